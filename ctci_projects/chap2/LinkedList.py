@@ -1,14 +1,32 @@
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
+import operator
+import sys
+from bisect import bisect_right
+from math import isqrt
 
-    def append_to_tail(self, data):
-        """Append node with given data to end of list."""
+from bloomFilter import BloomFilter, mix_hash
+from listNode import CycleDetected, guarded, Node as BaseNode
+
+# Peak bytes per entry of a set of existing objects, reached while it resizes
+SET_ENTRY_BYTES = 64
+
+
+class Node(BaseNode):
+    __slots__ = ()
+
+    def append_to_tail(self, data, guard=False):
+        """Append node with given data to end of list.
+
+        With guard=True a cyclic list raises CycleDetected instead of
+        searching forever for the tail.
+        """
         end = Node(data)
-        n = self
-        while n.next is not None:
-            n = n.next
+        if guard:
+            for n in guarded(self):
+                pass
+        else:
+            n = self
+            while n.next is not None:
+                n = n.next
         n.next = end
 
     def delete_node(self, data):
@@ -28,12 +46,78 @@ class Node:
 
         return self  # Data not found
 
-    def remove_dupes(self):
-        """Remove duplicates using hash set. O(n) time, O(n) space."""
+    def delete_all(self, data):
+        """Delete every node with given data. Returns (new head, removed count)."""
+        return self.delete_where(lambda value: value == data)
+
+    def delete_many(self, values):
+        """Delete every node whose data is in values. Returns (new head, removed count).
+
+        Values are collected into a set, so purging k values is one O(n) pass
+        instead of k calls to delete_node.
+        """
+        return self.delete_where(set(values).__contains__)
+
+    def delete_where(self, predicate):
+        """Delete every node whose data satisfies predicate. O(n) time, O(1) space.
+
+        Returns (new head, removed count); the new head is None if every node
+        was removed.
+        """
+        head, _, removed = self._delete_where(predicate)
+        return head, removed
+
+    def _delete_where(self, predicate):
+        """delete_where that also returns the last kept node: (head, tail, removed)."""
+        removed = 0
+        head = self
+        while head is not None and predicate(head.data):
+            head = head.next
+            removed += 1
+
+        if head is None:
+            return None, None, removed
+
+        n = head
+        while n.next is not None:
+            if predicate(n.next.data):
+                n.next = n.next.next
+                removed += 1
+            else:
+                n = n.next
+
+        return head, n, removed
+
+    def remove_dupes(self, guard=False):
+        """Remove duplicates using hash set. O(n) time, O(n) space.
+
+        With guard=True a loop raises CycleDetected instead of spinning
+        forever. Nodes unlinked before the loop was found stay unlinked, and
+        the entry reported is that of the list as it then stands.
+        """
         seen = set()
         n = self
         seen.add(n.data)
 
+        if guard:
+            # Brent rounds over the candidates n.next, as in listNode.guarded
+            parked = self
+            power = 1
+            while True:
+                for _ in range(power):
+                    candidate = n.next
+                    if candidate is None:
+                        return
+                    if candidate is parked:
+                        raise CycleDetected.from_head(self)
+                    if candidate.data in seen:
+                        n.next = candidate.next
+                    else:
+                        seen.add(candidate.data)
+                        n = candidate
+                parked = candidate
+                power *= 2
+
         while n.next is not None:
             if n.next.data in seen:
                 n.next = n.next.next
@@ -54,6 +138,74 @@ class Node:
                     runner = runner.next
             current = current.next
 
+    def remove_dupes_bounded(self, max_bytes=1 << 20):
+        """Remove duplicates with a Bloom filter prefilter in about max_bytes. O(n) time.
+
+        Falls back to hash-partitioned passes if candidates outgrow the
+        budget; raises ValueError if max_bytes is below one set entry.
+        """
+        capacity = max_bytes // SET_ENTRY_BYTES
+        if capacity < 1:
+            raise ValueError(f"max_bytes={max_bytes} is below one set entry "
+                             f"({SET_ENTRY_BYTES} bytes)")
+
+        length = 0
+        n = self
+        while n is not None:
+            length += 1
+            n = n.next
+
+        # Filter and candidates share the budget; later candidates and seen do
+        max_candidates = capacity // 2
+        bloom = BloomFilter(max_bytes // 2, length)
+        candidates = set()
+        n = self
+        while n is not None:
+            if bloom.add(n.data):
+                candidates.add(n.data)
+                if len(candidates) > max_candidates:
+                    del bloom, candidates
+                    self._remove_dupes_partitioned(length, capacity)
+                    return
+            n = n.next
+        del bloom
+
+        if not candidates:
+            return
+
+        seen = set()
+        n = self
+        if n.data in candidates:
+            seen.add(n.data)
+        while n.next is not None:
+            value = n.next.data
+            if value not in candidates:
+                n = n.next
+            elif value in seen:
+                n.next = n.next.next
+            else:
+                seen.add(value)
+                n = n.next
+
+    def _remove_dupes_partitioned(self, length, capacity):
+        """Dedupe in ceil(length / capacity) passes, one hash partition each. O(n * passes)."""
+        partitions = -(-length // capacity)
+        for part in range(partitions):
+            seen = set()
+            # The head is a first occurrence, so prev is set before any unlink
+            prev = None
+            n = self
+            while n is not None:
+                value = n.data
+                if mix_hash(value) % partitions != part:
+                    prev = n
+                elif value in seen:
+                    prev.next = n.next
+                else:
+                    seen.add(value)
+                    prev = n
+                n = n.next
+
     def return_kth_to_last(self, k):
         """Find kth to last element using two pointers. O(n) time, O(1) space."""
         p1 = self
@@ -73,11 +225,27 @@ class Node:
         return p2
 
     def return_kth_to_last_recursive(self, k):
-        """Find kth to last element recursively. O(n) time, O(n) space."""
-        return self._kth_helper(k)[1]
+        """Find kth to last element by unwinding an explicit stack. O(n) time, O(n) space."""
+        return self._kth_helper_iterative(k)[1]
+
+    def _kth_helper_iterative(self, k):
+        """Helper: _kth_helper with the call stack replaced by a list of nodes."""
+        stack = []
+        n = self
+        while n.next is not None:
+            stack.append(n)
+            n = n.next
+
+        idx, node = 1, (None if k != 1 else n)
+        while stack:
+            n = stack.pop()
+            idx += 1
+            if idx == k:
+                node = n
+        return (idx, node)
 
     def _kth_helper(self, k):
-        """Helper: returns (index from end, node)."""
+        """Helper: returns (index from end, node). Recurses once per node."""
         if self.next is None:
             return (1, None if k != 1 else self)
 
@@ -134,6 +302,77 @@ class Node:
         before_end.next = after_start
         return before_start
 
+    def partition_by(self, pivots, return_buckets=False):
+        """Stable partition into len(pivots) + 1 ranges in one pass. O(n) time, O(k) space.
+
+        pivots must be sorted; bucket i holds values v with
+        pivots[i - 1] <= v < pivots[i], so partition_by([x]) matches
+        partition(x). Returns the new head, or (head, heads, tails) with
+        per-bucket heads and tails (None for empty buckets) if return_buckets.
+        """
+        return self._partition_buckets(lambda value: bisect_right(pivots, value),
+                                       len(pivots) + 1, return_buckets)
+
+    def partition_key(self, key_fn, n_buckets, return_buckets=False):
+        """Stable partition by key_fn(value) in range(n_buckets). O(n) time, O(k) space.
+
+        Returns the new head, or (head, heads, tails) if return_buckets.
+        A non-int key raises TypeError and one outside range(n_buckets)
+        ValueError; on those or any error from key_fn the list keeps every
+        node, still starting at this node, with the nodes seen so far grouped.
+        """
+        return self._partition_buckets(key_fn, n_buckets, return_buckets)
+
+    def _partition_buckets(self, bucket_of, n_buckets, return_buckets):
+        """Relink nodes into bucket_of(data) sublists, then chain them in order."""
+        heads = [None] * n_buckets
+        tails = [None] * n_buckets
+
+        current = self
+        try:
+            while current is not None:
+                # Check the bucket before detaching, so a bad key loses nothing
+                bucket = operator.index(bucket_of(current.data))
+                if not 0 <= bucket < n_buckets:
+                    raise ValueError(f"bucket {bucket!r} for {current.data!r} "
+                                     f"not in range({n_buckets})")
+                next_node = current.next
+                current.next = None
+
+                if heads[bucket] is None:
+                    heads[bucket] = current
+                else:
+                    tails[bucket].next = current
+                tails[bucket] = current
+
+                current = next_node
+        except Exception:
+            if current is not self:
+                # Relink self's bucket, the other buckets, then the unvisited rest
+                first = heads.index(self)
+                end = tails[first]
+                for bucket in range(n_buckets):
+                    if bucket != first and heads[bucket] is not None:
+                        end.next = heads[bucket]
+                        end = tails[bucket]
+                end.next = current
+            raise
+
+        head = None
+        end = None
+        for bucket in range(n_buckets):
+            if heads[bucket] is None:
+                continue
+            if head is None:
+                head = heads[bucket]
+            else:
+                end.next = heads[bucket]
+            end = tails[bucket]
+
+        if return_buckets:
+            return head, heads, tails
+        return head
+
     def partition_prepend(self, x):
         """Partition by prepending smaller elements to head. O(n) time, O(1) space."""
         head = self
@@ -155,23 +394,344 @@ class Node:
         tail.next = None
         return head
 
-    def print_list(self):
-        """Print all nodes in the list."""
-        values = []
-        n = self
+    def sort(self, key=None, reverse=False):
+        """Stable in-place merge sort by relinking nodes. Returns the new head.
+
+        Bottom-up and non-recursive: each pass merges adjacent natural runs
+        (strictly descending runs are reversed as they are found), so the
+        list is sorted after O(log r) passes for r initial runs. Sorted input
+        is a single run and costs one O(n) pass. O(1) extra space.
+        """
+        if key is None:
+            if reverse:
+                def in_order(a, b):
+                    return not a.data < b.data
+            else:
+                def in_order(a, b):
+                    return not b.data < a.data
+        elif reverse:
+            def in_order(a, b):
+                return not key(a.data) < key(b.data)
+        else:
+            def in_order(a, b):
+                return not key(b.data) < key(a.data)
+
+        dummy = Node(None)
+        head = self
+        while True:
+            end = dummy
+            runs = 0
+            rest = head
+            while rest is not None:
+                first, first_end, rest = _take_run(rest, in_order)
+                runs += 1
+                if rest is None:
+                    end.next = first
+                    end = first_end
+                    break
+                second, second_end, rest = _take_run(rest, in_order)
+                runs += 1
+                end = _merge_runs(first, first_end, second, second_end, end, in_order)
+            head = dummy.next
+            if runs <= 1:
+                return head
+
+    def print_list(self, guard=False):
+        """Print all nodes in the list, streaming them in chunks."""
+        self.write_to(sys.stdout, guard=guard)
+        sys.stdout.write("\n")
+
+
+def _take_run(head, in_order):
+    """Detach the maximal run at head. Returns (run head, run tail, rest).
+
+    A run is non-decreasing under in_order, or strictly decreasing, in which
+    case it is reversed in place; reversing keeps stability since a strictly
+    decreasing run holds no equal elements.
+    """
+    tail = head
+    if tail.next is not None and not in_order(tail, tail.next):
+        while tail.next is not None and not in_order(tail, tail.next):
+            tail = tail.next
+        rest = tail.next
+        prev = None
+        n = head
+        while n is not rest:
+            next_node = n.next
+            n.next = prev
+            prev = n
+            n = next_node
+        return tail, head, rest
+
+    while tail.next is not None and in_order(tail, tail.next):
+        tail = tail.next
+    rest = tail.next
+    tail.next = None
+    return head, tail, rest
+
+
+def _merge_runs(a, a_end, b, b_end, end, in_order):
+    """Merge runs a and b after node end, preferring a on ties. Returns new end."""
+    while a is not None and b is not None:
+        if in_order(a, b):
+            end.next = a
+            end = a
+            a = a.next
+        else:
+            end.next = b
+            end = b
+            b = b.next
+    if a is not None:
+        end.next = a
+        return a_end
+    end.next = b
+    return b_end
+
+
+class SkipIndex:
+    """Checkpoints every stride-th node of a list for positional lookups.
+
+    With the default stride of √n, node_at and kth_to_last cost O(√n)
+    instead of a walk from the head. Appends extend the index in O(1);
+    any other mutation of the list makes it stale. fixed records that the
+    caller chose the stride.
+    """
+
+    __slots__ = ("checkpoints", "stride", "fixed", "length")
+
+    def __init__(self, head, stride=None):
+        length = 0
+        n = head
+        while n is not None:
+            length += 1
+            n = n.next
+
+        self.fixed = stride is not None
+        self.stride = stride or max(1, isqrt(length))
+        self.checkpoints = []
+        self.length = 0
+        n = head
         while n is not None:
-            values.append(str(n.data))
+            self.append(n)
             n = n.next
-        print(" -> ".join(values))
 
-    def to_list(self):
+    def append(self, node):
+        """Record node as the new last node of the list."""
+        if self.length % self.stride == 0:
+            self.checkpoints.append(node)
+        self.length += 1
+
+    def node_at(self, k):
+        """Return node at 0-based position k from the head, or None."""
+        if k < 0 or k >= self.length:
+            return None
+        n = self.checkpoints[k // self.stride]
+        for _ in range(k % self.stride):
+            n = n.next
+        return n
+
+    def kth_to_last(self, k):
+        """Return kth to last node (k=1 is the tail), or None."""
+        if k < 1 or k > self.length:
+            return None
+        return self.node_at(self.length - k)
+
+
+class LinkedList:
+    """Owner of a Node chain that caches head, tail and length.
+
+    Appends and len() are O(1); operations that relink the chain delegate
+    to Node and then refresh the cached tail and length. build_index adds a
+    SkipIndex for repeated positional queries; appends keep it current and
+    other mutations drop it. A √n-stride index that appends have outgrown
+    is rebuilt on the next lookup.
+    """
+
+    def __init__(self, values=None):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self._index = None
+        self._regrow_index = False
+        if values is not None:
+            for value in values:
+                self.append_to_tail(value)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        if self.head is None:
+            return iter(())
+        return iter(self.head)
+
+    def append_to_tail(self, data):
+        """Append node with given data to end of list. O(1) time."""
+        end = Node(data)
+        if self.head is None:
+            self.head = end
+        else:
+            self.tail.next = end
+        self.tail = end
+        self.length += 1
+        if self._index is not None:
+            # Drop a default-stride index once √n has doubled; node_at rebuilds it
+            if not self._index.fixed and self.length > 4 * self._index.stride ** 2:
+                self._index = None
+                self._regrow_index = True
+            else:
+                self._index.append(end)
+        return end
+
+    def delete_node(self, data):
+        """Delete first node with given data. Returns True if a node was removed."""
+        prev = None
+        n = self.head
+        while n is not None:
+            if n.data == data:
+                if prev is None:
+                    self.head = n.next
+                else:
+                    prev.next = n.next
+                if n is self.tail:
+                    self.tail = prev
+                self.length -= 1
+                self._index = None
+                return True
+            prev = n
+            n = n.next
+        return False
+
+    def delete_all(self, data):
+        """Delete every node with given data. Returns removed count."""
+        return self.delete_where(lambda value: value == data)
+
+    def delete_many(self, values):
+        """Delete every node whose data is in values. Returns removed count."""
+        return self.delete_where(set(values).__contains__)
+
+    def delete_where(self, predicate):
+        """Delete every node whose data satisfies predicate. Returns removed count."""
+        if self.head is None:
+            return 0
+        # One traversal: predicate may be stateful, so it is called once per node
+        self.head, self.tail, removed = self.head._delete_where(predicate)
+        if removed:
+            self.length -= removed
+            self._index = None
+        return removed
+
+    def delete_middle_node(self, node):
+        """Delete node (must not be last) by copying its successor. O(1) time."""
+        if node.next is self.tail:
+            self.tail = node
+        if not node.delete_middle_node():
+            return False
+        self.length -= 1
+        self._index = None
+        return True
+
+    def remove_dupes(self, guard=False):
+        """Remove duplicates using hash set. O(n) time, O(n) space."""
+        if self.head is not None:
+            self.head.remove_dupes(guard)
+            self._refresh()
+
+    def remove_dupes_no_buffer(self):
+        """Remove duplicates without buffer. O(n²) time, O(1) space."""
+        if self.head is not None:
+            self.head.remove_dupes_no_buffer()
+            self._refresh()
+
+    def remove_dupes_bounded(self, max_bytes=1 << 20):
+        """Remove duplicates using about max_bytes of working memory."""
+        if self.head is not None:
+            self.head.remove_dupes_bounded(max_bytes)
+            self._refresh()
+
+    def partition(self, x):
+        """Partition list around value x. O(n) time, O(1) space."""
+        if self.head is not None:
+            self.head = self.head.partition(x)
+            self._refresh()
+
+    def sort(self, key=None, reverse=False):
+        """Stable in-place natural merge sort. O(n log n) time, O(1) space."""
+        if self.head is not None:
+            self.head = self.head.sort(key, reverse)
+            self._refresh()
+
+    def partition_by(self, pivots):
+        """Stable partition into len(pivots) + 1 ranges in one pass. O(n) time."""
+        self._partition_buckets(Node.partition_by, pivots)
+
+    def partition_key(self, key_fn, n_buckets):
+        """Stable partition by key_fn(value) in range(n_buckets). O(n) time."""
+        self._partition_buckets(Node.partition_key, key_fn, n_buckets)
+
+    def _partition_buckets(self, partition, *args):
+        """Run a bucketing partition and take the tail from its last bucket."""
+        if self.head is None:
+            return
+        try:
+            self.head, heads, tails = partition(self.head, *args, return_buckets=True)
+        except Exception:
+            # The head and every node are kept, but the order and tail changed
+            self._refresh()
+            raise
+        self.tail = next(tail for tail in reversed(tails) if tail is not None)
+        self._index = None
+
+    def build_index(self, stride=None):
+        """Build a SkipIndex so node_at and return_kth_to_last run in O(√n)."""
+        self._index = SkipIndex(self.head, stride)
+        self._regrow_index = False
+        return self._index
+
+    def node_at(self, k):
+        """Return node at 0-based position k from the head, or None."""
+        if self._regrow_index and self._index is None:
+            self.build_index()
+        if self._index is not None:
+            return self._index.node_at(k)
+        if k < 0 or k >= self.length:
+            return None
+        n = self.head
+        for _ in range(k):
+            n = n.next
+        return n
+
+    def return_kth_to_last(self, k):
+        """Find kth to last element from the cached length. O(n - k) time, O(√n) indexed."""
+        if k < 1 or k > self.length:
+            return None
+        return self.node_at(self.length - k)
+
+    def print_list(self, guard=False):
+        """Print all nodes in the list."""
+        if self.head is None:
+            print("")
+        else:
+            self.head.print_list(guard)
+
+    def to_list(self, guard=False):
         """Convert linked list to Python list."""
-        result = []
-        n = self
+        if self.head is None:
+            return []
+        return self.head.to_list(guard)
+
+    def _refresh(self):
+        """Recompute tail and length after the chain was relinked."""
+        length = 0
+        tail = None
+        n = self.head
         while n is not None:
-            result.append(n.data)
+            length += 1
+            tail = n
             n = n.next
-        return result
+        self.tail = tail
+        self.length = length
+        self._index = None
 
 
 if __name__ == "__main__":
@@ -240,6 +800,21 @@ if __name__ == "__main__":
     head = head.delete_node(50)
     print(f"Delete 50: {head.to_list()}")
 
+    print("\n" + "=" * 60)
+    print("\nTesting bulk deletes:")
+    print("-" * 60)
+
+    head = Node(1)
+    for value in [2, 1, 3, 1, 4, 2]:
+        head.append_to_tail(value)
+    print(f"Start: {head.to_list()}")
+    head, removed = head.delete_all(1)
+    print(f"delete_all(1): {head.to_list()} (removed {removed})")
+    head, removed = head.delete_many([2, 4, 99])
+    print(f"delete_many([2, 4, 99]): {head.to_list()} (removed {removed})")
+    head, removed = head.delete_where(lambda value: value > 2)
+    print(f"delete_where(> 2): {head} (removed {removed})")
+
     print("\n" + "=" * 60)
     print("\nTesting remove_dupes:")
     print("-" * 60)
@@ -301,6 +876,29 @@ if __name__ == "__main__":
     head.remove_dupes_no_buffer()
     print(f"After remove_dupes_no_buffer: {head.to_list()}")
 
+    print("\n" + "=" * 60)
+    print("\nTesting remove_dupes_bounded:")
+    print("-" * 60)
+
+    head = Node(1)
+    for value in [2, 3, 2, 1, 4]:
+        head.append_to_tail(value)
+    print(f"Before: {head.to_list()}")
+    head.remove_dupes_bounded()
+    print(f"After remove_dupes_bounded: {head.to_list()}")
+
+    # Room for two set entries: candidates overflow, so it dedupes in hash partitions
+    head = Node(7)
+    for value in [8, 7, 9, 8, 7, 10, 11]:
+        head.append_to_tail(value)
+    print(f"\nBefore: {head.to_list()}")
+    head.remove_dupes_bounded(max_bytes=128)
+    print(f"After remove_dupes_bounded(max_bytes=128): {head.to_list()}")
+    try:
+        head.remove_dupes_bounded(max_bytes=1)
+    except ValueError as e:
+        print(f"max_bytes=1: ValueError: {e}")
+
     print("\n" + "=" * 60)
     print("\nTesting return_kth_to_last:")
     print("-" * 60)
@@ -403,6 +1001,41 @@ if __name__ == "__main__":
     result = head.to_list()
     print(f"After partition(6): {result}")
 
+    print("\n" + "=" * 60)
+    print("\nTesting partition_by and partition_key:")
+    print("-" * 60)
+
+    head = Node(3)
+    for value in [5, 8, 5, 10, 2, 1, 7, 12]:
+        head.append_to_tail(value)
+    print(f"Before: {head.to_list()}")
+    head, heads, tails = head.partition_by([3, 6, 10], return_buckets=True)
+    print(f"After partition_by([3, 6, 10]): {head.to_list()}")
+    bounds = [(h.data if h else None, t.data if t else None) for h, t in zip(heads, tails)]
+    print(f"Bucket (head, tail) pairs: {bounds}")
+
+    head = head.partition_key(lambda value: value % 3, 3)
+    print(f"After partition_key(value % 3, 3): {head.to_list()}")
+
+    print("\n" + "=" * 60)
+    print("\nTesting sort:")
+    print("-" * 60)
+
+    head = Node(3)
+    for value in [5, 8, 5, 10, 2, 1, 7]:
+        head.append_to_tail(value)
+    print(f"Before: {head.to_list()}")
+    head = head.sort()
+    print(f"After sort(): {head.to_list()}")
+    head = head.sort(reverse=True)
+    print(f"After sort(reverse=True): {head.to_list()}")
+
+    head = Node('pear')
+    for value in ['Fig', 'apple', 'kiwi', 'Date', 'plum']:
+        head.append_to_tail(value)
+    head = head.sort(key=len)
+    print(f"\nsort(key=len) keeps ties in order: {head.to_list()}")
+
     print("\n" + "=" * 60)
     print("\nTesting partition_prepend:")
     print("-" * 60)
@@ -421,3 +1054,70 @@ if __name__ == "__main__":
     less_than = [x for x in result if x < 5]
     greater_equal = [x for x in result if x >= 5]
     print(f"Elements < 5: {less_than}, Elements >= 5: {greater_equal}")
+
+    print("\n" + "=" * 60)
+    print("\nTesting lazy iteration and streaming:")
+    print("-" * 60)
+
+    head = Node(0)
+    for value in range(1, 10):
+        head.append_to_tail(value)
+    print(f"iter: {[value for value in head]}")
+    print(f"iter_slice(2, 8, 2): {list(head.iter_slice(2, 8, 2))}")
+    print("write_to(stdout, chunk_size=4): ", end="")
+    written = head.write_to(sys.stdout, chunk_size=4)
+    print(f" ({written} values)")
+
+    print("\n" + "=" * 60)
+    print("\nTesting LinkedList wrapper:")
+    print("-" * 60)
+
+    ll = LinkedList([3, 5, 8, 5, 10, 2, 1])
+    print(f"Created: {ll.to_list()} (length {len(ll)}, tail {ll.tail.data})")
+    print(f"Iterated: {list(ll)}")
+    ll.append_to_tail(7)
+    print(f"After append 7: {ll.to_list()} (length {len(ll)}, tail {ll.tail.data})")
+    ll.delete_node(7)
+    print(f"After delete 7: {ll.to_list()} (length {len(ll)}, tail {ll.tail.data})")
+    ll.delete_many([1, 10])
+    print(f"After delete_many([1, 10]): {ll.to_list()} (length {len(ll)}, tail {ll.tail.data})")
+    ll.append_to_tail(10)
+    ll.append_to_tail(1)
+    ll.remove_dupes()
+    print(f"After remove_dupes: {ll.to_list()} (length {len(ll)})")
+    ll.partition(5)
+    print(f"After partition(5): {ll.to_list()} (tail {ll.tail.data})")
+    ll.partition_by([2, 6])
+    print(f"After partition_by([2, 6]): {ll.to_list()} (tail {ll.tail.data})")
+    for k in range(len(ll) + 2):
+        result = ll.return_kth_to_last(k)
+        print(f"k={k}: {result.data if result else None}")
+
+    ll = LinkedList(range(20))
+    ll.build_index()
+    ll.append_to_tail(20)
+    print(f"\nIndexed {ll.to_list()}")
+    print(f"node_at(7): {ll.node_at(7).data}, kth_to_last(3): {ll.return_kth_to_last(3).data}")
+    ll.delete_middle_node(ll.node_at(5))
+    ll.build_index(stride=3)
+    print(f"After delete_middle_node at 5, reindexed: node_at(7): {ll.node_at(7).data}, "
+          f"kth_to_last(3): {ll.return_kth_to_last(3).data}")
+
+    print("\n" + "=" * 60)
+    print("\nTesting guarded traversal on a cyclic list:")
+    print("-" * 60)
+
+    head = Node(1)
+    for value in [2, 3, 4, 5]:
+        head.append_to_tail(value)
+    head.next.next.next.next.next = head.next.next  # 5 -> 3
+    walks = [
+        ("to_list", head.to_list),
+        ("append_to_tail", lambda guard: head.append_to_tail(6, guard)),
+        ("remove_dupes", head.remove_dupes),
+    ]
+    for name, walk in walks:
+        try:
+            walk(guard=True)
+        except CycleDetected as e:
+            print(f"{name}(guard=True): CycleDetected, entry {e.entry.data}")
@@ -1,19 +1,16 @@
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-
-    def to_list(self):
-        result = []
-        n = self
-        while n is not None:
-            result.append(n.data)
-            n = n.next
-        return result
-
-
-def sum_lists_reverse(l1, l2):
-    """Sum two lists where digits stored in reverse order. O(n) time and space."""
+from listNode import Node, guarded
+
+# Limb mode: each node holds LIMB_DIGITS decimal digits as one base-LIMB_BASE limb
+LIMB_DIGITS = 9
+LIMB_BASE = 10 ** LIMB_DIGITS
+
+
+def sum_lists_reverse(l1, l2, base=10):
+    """Sum two lists where digits stored in reverse order. O(n) time and space.
+
+    Digits may be limbs of any base, e.g. LIMB_BASE to carry 9 decimal
+    digits per node.
+    """
     dummy = Node(0)
     current = dummy
     carry = 0
@@ -23,8 +20,8 @@ def sum_lists_reverse(l1, l2):
         val2 = l2.data if l2 else 0
 
         total = val1 + val2 + carry
-        carry = total // 10
-        digit = total % 10
+        carry = total // base
+        digit = total % base
 
         current.next = Node(digit)
         current = current.next
@@ -35,8 +32,11 @@ def sum_lists_reverse(l1, l2):
     return dummy.next
 
 
-def sum_lists_forward(l1, l2):
-    """Sum two lists where digits stored in forward order. O(n) time and space."""
+def sum_lists_forward(l1, l2, base=10):
+    """Sum two lists where digits stored in forward order. O(n) time and space.
+
+    Digits may be limbs of any base, as for sum_lists_reverse.
+    """
     # Get lengths
     len1 = get_length(l1)
     len2 = get_length(l2)
@@ -47,8 +47,8 @@ def sum_lists_forward(l1, l2):
     else:
         l2 = pad_list(l2, len1 - len2)
 
-    # Add lists recursively
-    result = add_lists_helper(l1, l2)
+    # Add lists from the least significant digit up
+    result = add_lists_iterative(l1, l2, base)
 
     # Handle carry at front
     if result.carry > 0:
@@ -58,8 +58,150 @@ def sum_lists_forward(l1, l2):
     return result.node
 
 
-def get_length(head):
-    """Get length of linked list."""
+def sum_lists_forward_constant_space(l1, l2, in_place=False, base=10):
+    """Sum forward-order lists without padding or a stack. O(n) time, O(1) extra space.
+
+    Column sums are produced left to right. last_low tracks the latest
+    output digit below base - 1; a column that carries increments it and
+    zeroes the run of (base - 1) digits after it, so every digit is revisited
+    at most once. With in_place=True the sum is written into the longer
+    input's nodes and returned there; either way one spare node at the
+    front absorbs a final carry and is dropped if unused.
+    """
+    len1 = get_length(l1)
+    len2 = get_length(l2)
+    if len1 < len2:
+        l1, l2 = l2, l1
+        len1, len2 = len2, len1
+    if l1 is None:
+        return None
+
+    top = base - 1
+    head = Node(0)
+    last_low = head
+    current = head
+    skip = len1 - len2
+
+    while l1 is not None:
+        total = l1.data
+        if skip:
+            skip -= 1
+        else:
+            total += l2.data
+            l2 = l2.next
+
+        if in_place:
+            node = l1
+        else:
+            node = Node(0)
+        current.next = node
+        l1 = l1.next
+
+        if total >= base:
+            # Carry into last_low and turn the run of top digits after it into 0s
+            last_low.data += 1
+            n = last_low.next
+            while n is not node:
+                n.data = 0
+                n = n.next
+            total -= base
+        node.data = total
+        if total < top:
+            last_low = node
+        current = node
+
+    if head.data == 0:
+        return head.next
+    return head
+
+
+def sum_many_reverse(lists, base=10):
+    """Sum any number of reverse-order lists in one pass. O(total digits) time.
+
+    All cursors advance together; the column sum plus a multi-digit carry
+    yields one output digit, so only the output list is allocated.
+    """
+    cursors = [head for head in lists if head is not None]
+    dummy = Node(0)
+    current = dummy
+    carry = 0
+
+    while cursors or carry:
+        total = carry
+        exhausted = False
+        for i, node in enumerate(cursors):
+            total += node.data
+            cursors[i] = node.next
+            if node.next is None:
+                exhausted = True
+        if exhausted:
+            cursors = [node for node in cursors if node is not None]
+
+        carry, digit = divmod(total, base)
+        current.next = Node(digit)
+        current = current.next
+
+    return dummy.next
+
+
+def sum_many_forward(lists, base=10):
+    """Sum any number of forward-order lists in one pass. O(total digits) time.
+
+    Column sums are written left to right into the output nodes, which are
+    then reversed in place, normalized from the least significant end and
+    reversed back; only the output list is allocated.
+    """
+    sized = sorted(((get_length(head), head) for head in lists if head is not None),
+                   key=lambda item: item[0], reverse=True)
+    if not sized:
+        return None
+    width = sized[0][0]
+
+    # A list of length n joins the column sums at column width - n
+    cursors = []
+    dummy = Node(0)
+    current = dummy
+    for column in range(width):
+        while len(cursors) < len(sized) and sized[len(cursors)][0] >= width - column:
+            cursors.append(sized[len(cursors)][1])
+        total = 0
+        for i, node in enumerate(cursors):
+            total += node.data
+            cursors[i] = node.next
+        current.next = Node(total)
+        current = current.next
+
+    # Resolve carries from the least significant column
+    head = reverse_list(dummy.next)
+    carry = 0
+    n = head
+    while True:
+        carry, n.data = divmod(n.data + carry, base)
+        if n.next is None:
+            break
+        n = n.next
+    while carry:
+        carry, digit = divmod(carry, base)
+        n.next = Node(digit)
+        n = n.next
+    return reverse_list(head)
+
+
+def reverse_list(head):
+    """Reverse list in place. Returns new head. O(n) time, O(1) space."""
+    prev = None
+    while head is not None:
+        next_node = head.next
+        head.next = prev
+        prev = head
+        head = next_node
+    return prev
+
+
+def get_length(head, guard=False):
+    """Get length of linked list. guard=True raises CycleDetected on a loop."""
+    if guard:
+        return sum(1 for _ in guarded(head))
     length = 0
     while head:
         length += 1
@@ -77,13 +219,34 @@ def pad_list(head, padding):
 
 
 class PartialSum:
+    __slots__ = ("node", "carry")
+
     def __init__(self, node=None, carry=0):
         self.node = node
         self.carry = carry
 
 
+def add_lists_iterative(l1, l2, base=10):
+    """Add two equal-length lists with an explicit stack and return PartialSum."""
+    stack = []
+    while l1 is not None and l2 is not None:
+        stack.append(l1.data + l2.data)
+        l1 = l1.next
+        l2 = l2.next
+
+    result = PartialSum()
+    while stack:
+        total = stack.pop() + result.carry
+        new_node = Node(total % base)
+        new_node.next = result.node
+        result.node = new_node
+        result.carry = total // base
+
+    return result
+
+
 def add_lists_helper(l1, l2):
-    """Recursively add two lists and return PartialSum."""
+    """Recursively add two lists and return PartialSum. Recurses once per digit."""
     if l1 is None and l2 is None:
         return PartialSum()
 
@@ -114,6 +277,113 @@ def create_list(digits):
     return head
 
 
+def digits_to_limbs_reverse(head, limb_digits=LIMB_DIGITS):
+    """Pack a reverse-order digit list into reverse-order base 10**limb_digits limbs."""
+    dummy = Node(0)
+    current = dummy
+    while head is not None:
+        limb = 0
+        scale = 1
+        for _ in range(limb_digits):
+            if head is None:
+                break
+            limb += head.data * scale
+            scale *= 10
+            head = head.next
+        current.next = Node(limb)
+        current = current.next
+    return dummy.next
+
+
+def limbs_to_digits_reverse(head, limb_digits=LIMB_DIGITS):
+    """Unpack reverse-order limbs into a reverse-order digit list.
+
+    Zeros above the most significant nonzero digit are dropped; zero
+    unpacks to a single 0 digit.
+    """
+    if head is None:
+        return None
+    dummy = Node(0)
+    current = dummy
+    last_nonzero = None
+    while head is not None:
+        limb = head.data
+        for _ in range(limb_digits):
+            current.next = Node(limb % 10)
+            current = current.next
+            if current.data:
+                last_nonzero = current
+            limb //= 10
+        head = head.next
+
+    if last_nonzero is None:
+        return Node(0)
+    last_nonzero.next = None
+    return dummy.next
+
+
+def digits_to_limbs_forward(head, limb_digits=LIMB_DIGITS):
+    """Pack a forward-order digit list into forward-order base 10**limb_digits limbs."""
+    # The most significant limb takes the digits left over after full limbs
+    group = get_length(head) % limb_digits or limb_digits
+    dummy = Node(0)
+    current = dummy
+    while head is not None:
+        limb = 0
+        for _ in range(group):
+            limb = limb * 10 + head.data
+            head = head.next
+        current.next = Node(limb)
+        current = current.next
+        group = limb_digits
+    return dummy.next
+
+
+def limbs_to_digits_forward(head, limb_digits=LIMB_DIGITS):
+    """Unpack forward-order limbs into a forward-order digit list.
+
+    The leading limb is written without zero padding, every later limb as
+    exactly limb_digits digits.
+    """
+    if head is None:
+        return None
+    dummy = Node(0)
+    current = dummy
+    text = str(head.data)
+    while True:
+        for char in text:
+            current.next = Node(ord(char) - 48)
+            current = current.next
+        head = head.next
+        if head is None:
+            return dummy.next
+        text = f"{head.data:0{limb_digits}d}"
+
+
+def int_to_limbs(value, reverse=True, base=LIMB_BASE):
+    """Convert a non-negative int to a limb list, least significant limb first if reverse."""
+    limbs = []
+    while True:
+        value, limb = divmod(value, base)
+        limbs.append(limb)
+        if not value:
+            break
+    if not reverse:
+        limbs.reverse()
+    return create_list(limbs)
+
+
+def limbs_to_int(head, reverse=True, base=LIMB_BASE):
+    """Convert a limb list back to an int. Digit lists are limbs with base=10."""
+    limbs = head.to_list() if head is not None else []
+    if reverse:
+        limbs.reverse()
+    value = 0
+    for limb in limbs:
+        value = value * base + limb
+    return value
+
+
 if __name__ == "__main__":
     print("Testing sum_lists_reverse (digits in reverse order):")
     print("-" * 60)
@@ -177,3 +447,66 @@ if __name__ == "__main__":
     print(f"List 2: {l2.to_list()} (represents 500)")
     result = sum_lists_forward(l1, l2)
     print(f"Sum: {result.to_list()} (represents 1000)")
+
+    print("\n" + "=" * 60)
+    print("\nTesting sum_lists_forward_constant_space:")
+    print("-" * 60)
+
+    for digits1, digits2 in [([6, 1, 7], [2, 9, 5]), ([9, 9, 9], [1]),
+                             ([9, 9], [9, 9]), ([4, 9, 9, 3], [6, 8])]:
+        l1 = create_list(digits1)
+        l2 = create_list(digits2)
+        result = sum_lists_forward_constant_space(l1, l2)
+        print(f"{digits1} + {digits2} = {result.to_list()}")
+
+    l1 = create_list([4, 9, 9, 3])
+    l2 = create_list([6, 8])
+    result = sum_lists_forward_constant_space(l1, l2, in_place=True)
+    print(f"In place into the longer list: {result.to_list()} "
+          f"(reused its nodes: {result is l1})")
+
+    print("\n" + "=" * 60)
+    print("\nTesting sum_many_reverse and sum_many_forward:")
+    print("-" * 60)
+
+    # 617 + 295 + 9999 + 8 = 10919
+    lists = [create_list([7, 1, 6]), create_list([5, 9, 2]),
+             create_list([9, 9, 9, 9]), create_list([8])]
+    print(f"Reverse: {sum_many_reverse(lists).to_list()} (represents 10919)")
+    lists = [create_list([6, 1, 7]), create_list([2, 9, 5]),
+             create_list([9, 9, 9, 9]), create_list([8])]
+    print(f"Forward: {sum_many_forward(lists).to_list()} (represents 10919)")
+    lists = [create_list([9] * 3) for _ in range(200)]
+    print(f"200 x 999 forward: {sum_many_forward(lists).to_list()} (represents 199800)")
+
+    print("\n" + "=" * 60)
+    print("\nTesting limb mode (base 10**9 per node):")
+    print("-" * 60)
+
+    a = 98765432109876543210
+    b = 12345678901234567890
+    l1 = int_to_limbs(a)
+    l2 = int_to_limbs(b)
+    print(f"List 1 limbs (reverse): {l1.to_list()}")
+    print(f"List 2 limbs (reverse): {l2.to_list()}")
+    result = sum_lists_reverse(l1, l2, LIMB_BASE)
+    print(f"Sum limbs: {result.to_list()} (matches int sum: {limbs_to_int(result) == a + b})")
+
+    l1 = int_to_limbs(a, reverse=False)
+    l2 = int_to_limbs(b, reverse=False)
+    result = sum_lists_forward(l1, l2, LIMB_BASE)
+    print(f"Forward sum limbs: {result.to_list()} "
+          f"(matches int sum: {limbs_to_int(result, reverse=False) == a + b})")
+
+    digits = create_list([int(c) for c in str(a)])
+    limbs = digits_to_limbs_forward(digits)
+    print(f"\nDigits {digits.to_list()}")
+    print(f"-> limbs {limbs.to_list()} -> digits {limbs_to_digits_forward(limbs).to_list()}")
+    digits = create_list([7, 1, 6])
+    limbs = digits_to_limbs_reverse(digits)
+    print(f"Reverse digits [7, 1, 6] -> limbs {limbs.to_list()} "
+          f"-> digits {limbs_to_digits_reverse(limbs).to_list()}")
+
+    print("\nTesting base 2**30 limbs:")
+    result = sum_lists_reverse(int_to_limbs(a, base=2**30), int_to_limbs(b, base=2**30), 2**30)
+    print(f"Sum matches int sum: {limbs_to_int(result, base=2**30) == a + b}")
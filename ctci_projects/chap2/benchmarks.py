@@ -0,0 +1,736 @@
+"""Benchmarks for the chap2 linked list modules.
+
+Run all sections with `python benchmarks.py`, or name the ones to run:
+`python benchmarks.py node_memory`.
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+import LinkedList
+import SumLists
+import digitStreams
+import intersection
+import isLinkedListPalindrome
+import listArithmetic
+import loopDetector
+from arrayLinkedList import NodeArena
+from identitySet import IdentitySet
+from intersectionIndex import IntersectionIndex
+from listNode import Node
+from nodePool import NodePool
+
+
+class DictNode:
+    """Dict-backed node with the same fields, as the modules used to define."""
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+def build_chain(node_class, n, values=None):
+    """Build an n-node chain of node_class holding values (default 0..n-1)."""
+    if values is None:
+        values = range(n)
+    head = None
+    for i in range(n - 1, -1, -1):
+        node = node_class(values[i])
+        node.next = head
+        head = node
+    return head
+
+
+def measure_peak(func, *args):
+    """Return (result, peak bytes allocated) for func(*args) via tracemalloc."""
+    tracemalloc.start()
+    result = func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak
+
+
+def measure_bytes(build, *args):
+    """Return (result, bytes allocated) for build(*args) via tracemalloc."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(*args)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def bench_node_memory(n=200_000):
+    """Bytes per node for dict-backed vs slotted nodes."""
+    print(f"Node memory ({n:,} nodes, small int payloads):")
+    print("-" * 60)
+    values = [i % 256 for i in range(n)]
+    for node_class in (DictNode, Node):
+        head, used = measure_bytes(build_chain, node_class, n, values)
+        print(f"{node_class.__name__:>10}: {used / n:6.1f} bytes/node")
+        del head
+
+
+def timed(func, *args):
+    """Return (result, seconds) for a single call of func(*args)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_array_engine(n=1_000_000):
+    """Memory, GC-tracked objects and traversal cost of NodeArena vs Nodes."""
+    print(f"Array engine vs Node objects ({n:,} nodes):")
+    print("-" * 60)
+
+    tracked = len(gc.get_objects())
+    values = [i % 256 for i in range(n)]
+    head, used = measure_bytes(build_chain, Node, n, values)
+    tracked = len(gc.get_objects()) - tracked
+    _, secs = timed(head.to_list)
+    print(f"{'Node':>10}: {used / n:5.1f} bytes/node, "
+          f"{tracked:>9,} GC-tracked objects, to_list {secs:.3f}s")
+    del head
+
+    arena = NodeArena()
+    tracked = len(gc.get_objects())
+    arena_head, used = measure_bytes(arena.create_list, values)
+    tracked = len(gc.get_objects()) - tracked
+    _, secs = timed(arena.to_list, arena_head)
+    print(f"{'NodeArena':>10}: {used / n:5.1f} bytes/node, "
+          f"{tracked:>9,} GC-tracked objects, to_list {secs:.3f}s")
+
+
+def best_of(repeat, func, *args):
+    """Fastest of repeat timed calls of func(*args), in seconds."""
+    return min(timed(func, *args)[1] for _ in range(repeat))
+
+
+def timed_or_error(func, *args):
+    """Like timed, but report the exception name instead of raising."""
+    try:
+        return timed(func, *args)[1]
+    except RecursionError as e:
+        return type(e).__name__
+
+
+def format_seconds(value):
+    return f"{value:.4f}s" if isinstance(value, float) else value
+
+
+def bench_recursion_free(sizes=(500, 10**3, 10**4, 10**5, 10**6)):
+    """Recursive helpers vs their explicit-stack replacements."""
+    print(f"Recursive vs iterative (recursion limit {sys.getrecursionlimit()}):")
+    print("-" * 60)
+    print(f"{'algorithm':<22}{'n':>9}{'recursive':>16}{'iterative':>16}")
+    for n in sizes:
+        head = build_chain(LinkedList.Node, n)
+        cases = [
+            ("kth_to_last(k=n/2)", head._kth_helper, head._kth_helper_iterative, (n // 2,)),
+        ]
+        digits = SumLists.create_list([9] * n)
+        cases.append(("add_lists", SumLists.add_lists_helper,
+                      SumLists.add_lists_iterative, (digits, digits)))
+        values = isLinkedListPalindrome.create_list([i % 7 for i in range(n // 2)] * 2)
+        cases.append(("check_palindrome", isLinkedListPalindrome.check_palindrome,
+                      isLinkedListPalindrome.check_palindrome_iterative, (values, n)))
+
+        for name, recursive, iterative, args in cases:
+            print(f"{name:<22}{n:>9,}"
+                  f"{format_seconds(timed_or_error(recursive, *args)):>16}"
+                  f"{format_seconds(timed_or_error(iterative, *args)):>16}")
+
+
+def bench_bulk_delete(n=100_000, k=1_000):
+    """Purging k values: k delete_node calls vs one delete_many pass."""
+    print(f"Bulk delete ({n:,} nodes, {k:,} values to purge):")
+    print("-" * 60)
+    victims = range(0, n, n // k)
+
+    def delete_each(head):
+        for value in victims:
+            head = head.delete_node(value)
+        return head
+
+    head = build_chain(LinkedList.Node, n)
+    _, secs = timed(delete_each, head)
+    print(f"{'delete_node x k':>16}: {secs:.3f}s")
+
+    head = build_chain(LinkedList.Node, n)
+    (_, removed), secs = timed(head.delete_many, victims)
+    print(f"{'delete_many':>16}: {secs:.3f}s ({removed:,} removed)")
+
+
+class NullStream:
+    """Text stream that discards everything written to it."""
+
+    def write(self, text):
+        return len(text)
+
+
+def bench_streaming_export(n=1_000_000):
+    """Peak memory of join-then-write vs chunked write_to."""
+    print(f"Streaming export ({n:,} nodes):")
+    print("-" * 60)
+    head = build_chain(Node, n)
+    stream = NullStream()
+
+    def join_all():
+        stream.write(" -> ".join([str(value) for value in head.to_list()]))
+
+    for name, func in (("join", join_all), ("write_to", lambda: head.write_to(stream))):
+        _, secs = timed(func)
+        _, peak = measure_peak(func)
+        print(f"{name:>10}: peak {peak / 2**20:7.2f} MiB, {secs:.3f}s")
+
+
+def bench_dedupe(n=500_000, dupe_every=100, quadratic_n=5_000):
+    """Peak memory and throughput of the three remove_dupes modes."""
+    print(f"Duplicate removal (mostly unique values, 1 repeat per {dupe_every}):")
+    print("-" * 60)
+    rng = random.Random(7)
+    # Random keys: sequential ints would never collide in the Bloom filter
+    ints = [rng.getrandbits(64) for _ in range(n)]
+    keys = {
+        "random 64-bit ints": ints,
+        "strings": [f"key-{value:x}" for value in ints],
+    }
+    cases = [
+        ("remove_dupes", n, lambda head: head.remove_dupes()),
+        ("bounded 1 MiB", n, lambda head: head.remove_dupes_bounded(1 << 20)),
+        ("bounded 8 MiB", n, lambda head: head.remove_dupes_bounded(1 << 23)),
+        ("no_buffer", quadratic_n, lambda head: head.remove_dupes_no_buffer()),
+    ]
+    for kind, unique in keys.items():
+        values = [unique[i - 1] if i % dupe_every == 0 else unique[i] for i in range(n)]
+        print(f"{kind}:")
+        for name, size, dedupe in cases:
+            # Time and trace separately: tracemalloc slows every allocation
+            _, secs = timed(dedupe, build_chain(LinkedList.Node, size, values))
+            _, peak = measure_peak(dedupe, build_chain(LinkedList.Node, size, values))
+            print(f"{name:>15} ({size:>9,} nodes): peak {peak / 2**20:7.2f} MiB, "
+                  f"{size / secs:>12,.0f} nodes/s")
+
+
+def bench_sort(n=200_000):
+    """Node.sort vs copying out, sorting and rebuilding the chain."""
+    print(f"Sorting ({n:,} nodes):")
+    print("-" * 60)
+    rng = random.Random(42)
+    shapes = {
+        "random": [rng.randrange(n) for _ in range(n)],
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+    }
+
+    def copy_sort_rebuild(head):
+        return build_chain(LinkedList.Node, n, sorted(head.to_list()))
+
+    for shape, values in shapes.items():
+        _, rebuild = timed(copy_sort_rebuild, build_chain(LinkedList.Node, n, values))
+        _, in_place = timed(build_chain(LinkedList.Node, n, values).sort)
+        print(f"{shape:>9}: copy+sorted+rebuild {rebuild:.3f}s, Node.sort {in_place:.3f}s")
+
+
+def bench_skip_index(sizes=(10**4, 10**5, 10**6), queries=200):
+    """SkipIndex build cost, per-query saving and break-even query count."""
+    print("Positional queries: walk vs SkipIndex:")
+    print("-" * 60)
+    rng = random.Random(7)
+    for n in sizes:
+        ll = LinkedList.LinkedList(range(n))
+        ks = [rng.randint(1, n) for _ in range(queries)]
+
+        def run_queries():
+            for k in ks:
+                ll.return_kth_to_last(k)
+
+        _, walk = timed(run_queries)
+        _, build = timed(ll.build_index)
+        _, indexed = timed(run_queries)
+        saving = (walk - indexed) / queries
+        print(f"n={n:>9,}: walk {walk / queries * 1e6:9.1f}us/query, "
+              f"indexed {indexed / queries * 1e6:6.1f}us/query, "
+              f"build {build * 1e3:7.1f}ms, break-even {build / saving:5.1f} queries")
+
+
+def bench_limbs(n_digits=1_000_000):
+    """One digit per node vs base-10**9 limbs for reverse and forward sums."""
+    print(f"Digit lists vs limb lists ({n_digits:,} decimal digits):")
+    print("-" * 60)
+    rng = random.Random(11)
+    digits1 = [rng.randrange(10) for _ in range(n_digits)]
+    digits2 = [rng.randrange(10) for _ in range(n_digits)]
+    for order, to_limbs in (("reverse", SumLists.digits_to_limbs_reverse),
+                            ("forward", SumLists.digits_to_limbs_forward)):
+        add = getattr(SumLists, f"sum_lists_{order}")
+        l1 = SumLists.create_list(digits1)
+        l2 = SumLists.create_list(digits2)
+        _, digit_secs = timed(add, l1, l2)
+        l1 = to_limbs(l1)
+        l2 = to_limbs(l2)
+        limb_nodes = SumLists.get_length(l1)
+        _, limb_secs = timed(add, l1, l2, SumLists.LIMB_BASE)
+        print(f"{order:>8}: digits {n_digits:,} nodes {digit_secs:.3f}s, "
+              f"limbs {limb_nodes:,} nodes {limb_secs:.3f}s")
+
+
+def bench_forward_sum(sizes=(500, 10**3, 10**4, 10**5, 10**6)):
+    """Forward-order addition: recursive, explicit stack, constant space."""
+    print("Forward-order sum (time / peak extra memory):")
+    print("-" * 60)
+
+    def recursive(l1, l2):
+        return SumLists.add_lists_helper(l1, SumLists.pad_list(l2, 1)).node
+
+    rng = random.Random(5)
+    cases = [
+        ("recursive", recursive),
+        ("sum_lists_forward", SumLists.sum_lists_forward),
+        ("constant_space", SumLists.sum_lists_forward_constant_space),
+        ("constant_space in_place",
+         lambda l1, l2: SumLists.sum_lists_forward_constant_space(l1, l2, in_place=True)),
+    ]
+    for n in sizes:
+        digits1 = [rng.randrange(10) for _ in range(n)]
+        digits2 = [rng.randrange(10) for _ in range(n - 1)]
+        for name, add in cases:
+            l1 = SumLists.create_list(digits1)
+            l2 = SumLists.create_list(digits2)
+            secs = timed_or_error(add, l1, l2)
+            if isinstance(secs, float):
+                l1 = SumLists.create_list(digits1)
+                l2 = SumLists.create_list(digits2)
+                _, peak = measure_peak(add, l1, l2)
+                memory = f"{peak / 2**20:8.2f} MiB"
+            else:
+                memory = ""
+            print(f"{name:>24} n={n:>9,}: {format_seconds(secs):>15} {memory}")
+
+
+def bench_multiply(sizes=(100, 1_000, 5_000), thresholds=(16, 48, 128)):
+    """Schoolbook vs Karatsuba multiply_lists at several thresholds."""
+    print("multiply_lists (digits per operand):")
+    print("-" * 60)
+    rng = random.Random(13)
+    for n in sizes:
+        l1 = SumLists.create_list([rng.randrange(10) for _ in range(n)])
+        l2 = SumLists.create_list([rng.randrange(10) for _ in range(n)])
+        _, schoolbook = timed(listArithmetic.multiply_lists, l1, l2, False, n + 1)
+        karatsuba = "  ".join(
+            f"t={t}: {timed(listArithmetic.multiply_lists, l1, l2, False, t)[1]:.3f}s"
+            for t in thresholds)
+        print(f"n={n:>6,}: schoolbook {schoolbook:.3f}s  {karatsuba}")
+
+
+def bench_sum_many(n_lists=100, n_digits=10_000):
+    """Pairwise folding vs one-pass summation of many digit lists."""
+    print(f"Summing {n_lists} lists of {n_digits:,} digits:")
+    print("-" * 60)
+    rng = random.Random(17)
+    digit_lists = [[rng.randrange(10) for _ in range(n_digits)] for _ in range(n_lists)]
+    lists = [SumLists.create_list(digits) for digits in digit_lists]
+
+    for order in ("reverse", "forward"):
+        add_two = getattr(SumLists, f"sum_lists_{order}")
+        add_many = getattr(SumLists, f"sum_many_{order}")
+
+        def fold():
+            total = lists[0]
+            for head in lists[1:]:
+                total = add_two(total, head)
+            return total
+
+        _, folded = timed(fold)
+        _, folded_peak = measure_peak(fold)
+        _, many = timed(add_many, lists)
+        _, many_peak = measure_peak(add_many, lists)
+        print(f"{order:>8}: pairwise {folded:.3f}s peak {folded_peak / 2**20:6.2f} MiB, "
+              f"sum_many {many:.3f}s peak {many_peak / 2**20:6.2f} MiB")
+
+
+def bench_stream_add(sizes=(10**4, 10**5, 10**6)):
+    """Streaming adders: peak memory stays flat as the digit count grows."""
+    print("Streaming digit addition (generated digit streams):")
+    print("-" * 60)
+
+    def digits(n, seed):
+        rng = random.Random(seed)
+        return (rng.randrange(10) for _ in range(n))
+
+    def consume(stream):
+        count = 0
+        for _ in stream:
+            count += 1
+        return count
+
+    for n in sizes:
+        for order in ("reverse", "forward"):
+            add = getattr(digitStreams, f"add_digit_streams_{order}")
+            _, secs = timed(consume, add(digits(n, 1), digits(n, 2)))
+            _, peak = measure_peak(consume, add(digits(n, 1), digits(n, 2)))
+            print(f"n={n:>9,} {order:>8}: {secs:.3f}s, peak {peak / 1024:6.1f} KiB")
+
+
+def bench_digit_arrays(n_digits=1_000_000, pairs=10_000, width=100):
+    """sum_lists_reverse vs NumPy add_digit_arrays, single and batched."""
+    import numpy as np
+
+    import digitArrays
+
+    print("Digit arrays (NumPy) vs digit lists:")
+    print("-" * 60)
+    rng = np.random.default_rng(19)
+    a = rng.integers(0, 10, size=n_digits, dtype=np.uint8)
+    b = rng.integers(0, 10, size=n_digits, dtype=np.uint8)
+    l1 = digitArrays.array_to_list(a)
+    l2 = digitArrays.array_to_list(b)
+    _, list_secs = timed(SumLists.sum_lists_reverse, l1, l2)
+    _, array_secs = timed(digitArrays.add_digit_arrays, a, b)
+    print(f"one pair of {n_digits:,} digits: lists {list_secs:.3f}s, arrays {array_secs:.4f}s")
+
+    a = rng.integers(0, 10, size=(pairs, width), dtype=np.uint8)
+    b = rng.integers(0, 10, size=(pairs, width), dtype=np.uint8)
+    lists = [(digitArrays.array_to_list(x), digitArrays.array_to_list(y)) for x, y in zip(a, b)]
+
+    def add_each():
+        for l1, l2 in lists:
+            SumLists.sum_lists_reverse(l1, l2)
+
+    _, list_secs = timed(add_each)
+    _, array_secs = timed(digitArrays.add_digit_arrays, a, b)
+    print(f"{pairs:,} pairs of {width} digits: lists {list_secs:.3f}s, "
+          f"one 2-D call {array_secs:.4f}s")
+
+
+def bench_intersection_index(n_lists=2_000, trunk=5_000, branch=500, queries=2_000):
+    """Repeated pairwise intersection queries: aligned walk vs IntersectionIndex."""
+    print(f"Intersection queries ({n_lists:,} lists on a {trunk:,}-node trunk):")
+    print("-" * 60)
+    rng = random.Random(23)
+    shared = []
+    n = build_chain(Node, trunk)
+    while n is not None:
+        shared.append(n)
+        n = n.next
+
+    heads = []
+    for _ in range(n_lists):
+        head = rng.choice(shared)
+        for i in range(rng.randrange(branch)):
+            node = Node(i)
+            node.next = head
+            head = node
+        heads.append(head)
+    pairs = [(rng.randrange(n_lists), rng.randrange(n_lists)) for _ in range(queries)]
+
+    def aligned():
+        for i, j in pairs:
+            intersection.find_intersection_aligned(heads[i], heads[j])
+
+    _, walk = timed(aligned)
+    index, build = timed(IntersectionIndex, heads)
+
+    def indexed():
+        for i, j in pairs:
+            index.intersection(i, j)
+
+    _, lookup = timed(indexed)
+    print(f"find_intersection_aligned: {walk / queries * 1e6:8.1f}us/query")
+    print(f"IntersectionIndex:         {lookup / queries * 1e6:8.1f}us/query "
+          f"(build {build:.2f}s for {len(index.nodes):,} nodes)")
+
+
+def bench_identity_set(sizes=(10**6,)):
+    """Builtin set vs IdentitySet as the visited set of find_loop_start_hash.
+
+    Pass sizes=(10**7,) for the large case; it needs about 1 GB.
+    """
+    print("Visited-set memory and speed (acyclic list, every node visited):")
+    print("-" * 60)
+    for n in sizes:
+        head = build_chain(Node, n)
+        for factory in (set, IdentitySet):
+            _, secs = timed(loopDetector.find_loop_start_hash, head, factory)
+            _, peak = measure_peak(loopDetector.find_loop_start_hash, head, factory)
+            print(f"n={n:>11,} {factory.__name__:>12}: {secs:.3f}s, "
+                  f"{peak / n:5.1f} bytes/node peak")
+        del head
+
+
+class CountingNode(Node):
+    """Node that counts every read of .next, i.e. every pointer step."""
+
+    __slots__ = ("_next",)
+    steps = 0
+
+    @property
+    def next(self):
+        CountingNode.steps += 1
+        return self._next
+
+    @next.setter
+    def next(self, node):
+        self._next = node
+
+
+def bench_loop_detection(shapes=((10, 10**5), (10**5, 10), (5 * 10**4, 5 * 10**4),
+                                 (10**5, 10**5), (1, 2 * 10**5))):
+    """Pointer steps and wall time of Floyd, hash and Brent across μ/λ shapes."""
+    print("Loop detection (μ = tail length, λ = cycle length):")
+    print("-" * 60)
+    algorithms = [
+        ("floyd", loopDetector.find_loop_start),
+        ("hash", loopDetector.find_loop_start_hash),
+        ("brent", loopDetector.find_loop_brent),
+    ]
+    for mu, lam in shapes:
+        values = range(mu + lam)
+        counting = loopDetector.create_loop_list(values, mu, CountingNode)
+        plain = loopDetector.create_loop_list(values, mu)
+        cells = []
+        for name, find in algorithms:
+            CountingNode.steps = 0
+            find(counting)
+            secs = best_of(5, find, plain)
+            cells.append(f"{name} {CountingNode.steps:>8,} steps {secs * 1e3:6.1f}ms")
+        print(f"μ={mu:>7,} λ={lam:>7,}: " + " | ".join(cells))
+
+
+def bench_successor_arrays(n_lists=2_000, length=500, n=1_000_000):
+    """Per-head find_loop_brent vs one analyze_successors pass over every index."""
+    import numpy as np
+
+    import successorArrays
+
+    print("Successor arrays (NumPy) vs per-head loop detection:")
+    print("-" * 60)
+    rng = random.Random(29)
+    heads = [loopDetector.create_loop_list(range(length), rng.choice([None, rng.randrange(length)]))
+             for _ in range(n_lists)]
+
+    def brent_each():
+        for head in heads:
+            loopDetector.find_loop_brent(head)
+
+    _, brent_secs = timed(brent_each)
+    (successors, _, _), convert_secs = timed(successorArrays.nodes_to_successors, heads)
+    _, analyze_secs = timed(successorArrays.analyze_successors, successors)
+    print(f"{n_lists:,} Node lists of {length}: brent per head {brent_secs:.3f}s, "
+          f"convert {convert_secs:.3f}s + analyze {analyze_secs:.4f}s")
+
+    # NodeArena's next column already is a successor array
+    arena = NodeArena()
+    arena_heads = []
+    for _ in range(n_lists):
+        head = arena.create_list(range(length))
+        loop_index = rng.choice([None, rng.randrange(length)])
+        if loop_index is not None:
+            arena.next[head + length - 1] = head + loop_index
+        arena_heads.append(head)
+
+    def floyd_each():
+        for head in arena_heads:
+            arena.find_loop_start(head)
+
+    _, floyd_secs = timed(floyd_each)
+    successors = np.frombuffer(arena.next, dtype=np.int64)
+    _, analyze_secs = timed(successorArrays.analyze_successors, successors)
+    sample = rng.sample(range(len(arena)), 1_000)
+
+    def floyd_sample():
+        for i in sample:
+            arena.find_loop_start(i)
+
+    _, sample_secs = timed(floyd_sample)
+    per_index_secs = sample_secs * len(arena) / len(sample)
+    print(f"{n_lists:,} NodeArena lists of {length}: floyd per head {floyd_secs:.3f}s, "
+          f"every index as a head ~{per_index_secs:.1f}s (from 1,000), "
+          f"analyze every index {analyze_secs:.4f}s")
+
+    shapes = [
+        ("random successors", np.random.default_rng(29).integers(-1, n, size=n)),
+        ("one long rho", np.append(np.arange(1, n), n // 2)),
+    ]
+    for name, successors in shapes:
+        _, secs = timed(successorArrays.analyze_successors, successors)
+        print(f"{name} ({n:,} indices): analyze {secs:.3f}s")
+
+
+def bench_guard(n=1_000_000):
+    """Overhead of guard=True (Brent cycle check in the same pass) on each walker."""
+    print(f"Guarded traversal overhead ({n:,}-node acyclic list):")
+    print("-" * 60)
+    head = build_chain(LinkedList.Node, n)
+    out = NullStream()
+    cases = [
+        ("to_list", head.to_list),
+        ("write_to", lambda guard: head.write_to(out, guard=guard)),
+        ("append_to_tail", lambda guard: head.append_to_tail(0, guard)),
+        ("get_length", lambda guard: SumLists.get_length(head, guard)),
+        ("get_length_and_tail", lambda guard: intersection.get_length_and_tail(head, guard)),
+    ]
+    for name, walk in cases:
+        plain = best_of(5, walk, False)
+        guarded = best_of(5, walk, True)
+        print(f"{name:>20}: plain {plain * 1e3:6.1f}ms, guarded {guarded * 1e3:6.1f}ms "
+              f"({guarded / plain:.2f}x)")
+
+    dupes = [i % 1000 for i in range(n)]
+
+    def dedupe(guard):
+        return timed(build_chain(LinkedList.Node, n, dupes).remove_dupes, guard)[1]
+
+    plain = min(dedupe(False) for _ in range(3))
+    guarded = min(dedupe(True) for _ in range(3))
+    print(f"{'remove_dupes':>20}: plain {plain * 1e3:6.1f}ms, guarded {guarded * 1e3:6.1f}ms "
+          f"({guarded / plain:.2f}x)")
+
+
+def bench_node_pool(n=100_000, rewires=1_000):
+    """Loop check after each splice: NodePool.set_next vs find_loop_brent from the head."""
+    print(f"Splice and check for loops ({n:,}-node list, {rewires:,} splices):")
+    print("-" * 60)
+    rng = random.Random(31)
+    # Point a random node at another one, check the head, then restore the link
+    moves = [(rng.randrange(n), rng.randrange(n)) for _ in range(rewires)]
+
+    nodes = []
+    head = build_chain(Node, n)
+    while head is not None:
+        nodes.append(head)
+        head = head.next
+
+    def splice_and_walk():
+        loops = 0
+        for a, b in moves:
+            old = nodes[a].next
+            nodes[a].next = nodes[b]
+            loops += loopDetector.find_loop_brent(nodes[0]) is not None
+            nodes[a].next = old
+        return loops
+
+    pool = NodePool()
+    pool.create_list(range(n))
+    pooled = pool.nodes
+
+    def splice_pooled():
+        loops = 0
+        for a, b in moves:
+            old = pooled[a].next
+            loops += pool.set_next(pooled[a], pooled[b])
+            pool.set_next(pooled[a], old)
+        return loops
+
+    walk_loops, walk_secs = timed(splice_and_walk)
+    pool_loops, pool_secs = timed(splice_pooled)
+    print(f"find_loop_brent after each: {walk_secs:.3f}s "
+          f"({walk_secs / rewires * 1e6:,.0f}us/splice)")
+    print(f"NodePool.set_next:          {pool_secs:.3f}s "
+          f"({pool_secs / rewires * 1e6:,.0f}us/splice)")
+    print(f"splices closing a loop: {walk_loops:,} vs {pool_loops:,}")
+
+
+def bench_palindrome(sizes=(10**3, 10**4, 10**5, 10**6)):
+    """Peak memory and time of the palindrome checks on palindromic lists."""
+    print("Palindrome checks (worst case: the whole list is a palindrome):")
+    print("-" * 60)
+
+    def recursive(head):
+        length = isLinkedListPalindrome.get_length(head)
+        return isLinkedListPalindrome.check_palindrome(head, length).is_palindrome
+
+    checks = [
+        ("stack", isLinkedListPalindrome.is_palindrome_stack),
+        ("reverse", isLinkedListPalindrome.is_palindrome_reverse),
+        ("runner", isLinkedListPalindrome.is_palindrome_runner),
+        ("recursive", recursive),
+        ("explicit", isLinkedListPalindrome.is_palindrome_recursive),
+        ("inplace", isLinkedListPalindrome.is_palindrome_inplace),
+    ]
+    for n in sizes:
+        half = [i % 97 for i in range(n // 2)]
+        head = build_chain(Node, n, half + half[::-1])
+        for name, check in checks:
+            try:
+                _, peak = measure_peak(check, head)
+            except RecursionError as e:
+                # measure_peak was interrupted before stopping the trace
+                tracemalloc.stop()
+                print(f"n={n:>9,} {name:>10}: {type(e).__name__} (n/2 frames)")
+                continue
+            secs = best_of(3, check, head)
+            print(f"n={n:>9,} {name:>10}: peak {peak / 1024:10,.1f} KiB, {secs * 1e3:8.1f}ms")
+
+
+def bench_palindrome_stream(n=1_000_000):
+    """PalindromeStream per-value cost and memory vs rechecking a growing list."""
+    print(f"Online palindrome prefixes ({n:,} values):")
+    print("-" * 60)
+    half = [i % 97 for i in range(n // 2)]
+    values = half + half[::-1]
+
+    def stream_all():
+        stream = isLinkedListPalindrome.PalindromeStream()
+        return sum(map(stream.append, values))
+
+    hits, secs = timed(stream_all)
+    _, peak = measure_peak(stream_all)
+    print(f"PalindromeStream: {secs / n * 1e9:6.0f}ns/value, peak {peak / 1024:,.1f} KiB, "
+          f"{hits:,} palindromic prefixes")
+
+    # Rechecking each prefix with the in-place check is quadratic; time a short stream
+    m = 2_000
+    head = tail = None
+
+    def recheck_all():
+        nonlocal head, tail
+        hits = 0
+        for value in values[:m]:
+            node = Node(value)
+            if head is None:
+                head = tail = node
+            else:
+                tail.next = node
+                tail = node
+            hits += isLinkedListPalindrome.is_palindrome_inplace(head)
+        return hits
+
+    _, secs = timed(recheck_all)
+    print(f"is_palindrome_inplace per prefix ({m:,} values): {secs / m * 1e9:,.0f}ns/value")
+
+
+BENCHMARKS = {
+    "node_memory": bench_node_memory,
+    "array_engine": bench_array_engine,
+    "recursion_free": bench_recursion_free,
+    "bulk_delete": bench_bulk_delete,
+    "streaming_export": bench_streaming_export,
+    "dedupe": bench_dedupe,
+    "sort": bench_sort,
+    "skip_index": bench_skip_index,
+    "limbs": bench_limbs,
+    "forward_sum": bench_forward_sum,
+    "multiply": bench_multiply,
+    "sum_many": bench_sum_many,
+    "stream_add": bench_stream_add,
+    "digit_arrays": bench_digit_arrays,
+    "intersection_index": bench_intersection_index,
+    "identity_set": bench_identity_set,
+    "loop_detection": bench_loop_detection,
+    "successor_arrays": bench_successor_arrays,
+    "guard": bench_guard,
+    "node_pool": bench_node_pool,
+    "palindrome": bench_palindrome,
+    "palindrome_stream": bench_palindrome_stream,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for i, name in enumerate(names):
+        if i:
+            print("\n" + "=" * 60 + "\n")
+        BENCHMARKS[name]()
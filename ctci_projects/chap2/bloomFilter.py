@@ -0,0 +1,69 @@
+from math import log
+
+MASK64 = (1 << 64) - 1
+
+
+def mix_hash(value):
+    """hash(value) spread over 64 bits by a Fibonacci multiply."""
+    return (hash(value) * 0x9E3779B97F4A7C15) & MASK64
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over hashable values, backed by a bytearray.
+
+    Membership answers are "definitely absent" or "possibly present"; the
+    false-positive rate depends on size_bytes relative to expected_items.
+    """
+
+    __slots__ = ("bits", "size", "hash_count")
+
+    def __init__(self, size_bytes, expected_items):
+        size_bytes = max(1, size_bytes)
+        self.bits = bytearray(size_bytes)
+        self.size = size_bytes * 8
+        # Optimal k = (m / n) ln 2; capped since every hash is a Python-level step
+        k = round(self.size / max(1, expected_items) * log(2))
+        self.hash_count = min(8, max(1, k))
+
+    def _hashes(self, value):
+        """Two independent 64-bit hashes of value for double hashing."""
+        x = mix_hash(value)
+        return x, (((x >> 29) ^ x) * 0xBF58476D1CE4E5B9 & MASK64) | 1
+
+    def add(self, value):
+        """Add value. Returns True if it was possibly present already."""
+        bits = self.bits
+        size = self.size
+        pos, step = self._hashes(value)
+        present = True
+        for _ in range(self.hash_count):
+            pos %= size
+            mask = 1 << (pos & 7)
+            byte = bits[pos >> 3]
+            if not byte & mask:
+                present = False
+                bits[pos >> 3] = byte | mask
+            pos += step
+        return present
+
+    def __contains__(self, value):
+        bits = self.bits
+        size = self.size
+        pos, step = self._hashes(value)
+        for _ in range(self.hash_count):
+            pos %= size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+            pos += step
+        return True
+
+
+if __name__ == "__main__":
+    bloom = BloomFilter(1024, 1000)
+    print(f"Bloom filter: {bloom.size} bits, {bloom.hash_count} hashes")
+    for value in range(1000):
+        bloom.add(value)
+    misses = sum(1 for value in range(1000) if value not in bloom)
+    false_positives = sum(1 for value in range(1000, 11000) if value in bloom)
+    print(f"False negatives: {misses} (expected 0)")
+    print(f"False positive rate: {false_positives / 10000:.3%}")
@@ -0,0 +1,89 @@
+import numpy as np
+
+from SumLists import create_list
+
+
+def list_to_array(head):
+    """Copy a reverse-order digit list into a uint8 array, least significant first."""
+    return np.fromiter(head if head is not None else (), dtype=np.uint8)
+
+
+def array_to_list(digits):
+    """Build a reverse-order digit list from a 1-D digit array."""
+    return create_list(np.asarray(digits).tolist())
+
+
+def add_digit_arrays(a, b):
+    """Add reverse-order uint8 digit arrays without a Python-level carry loop.
+
+    1-D inputs may differ in length and give the same digits as
+    sum_lists_reverse. 2-D inputs hold one number per row and must have the
+    same shape; the result has one extra column for each row's final carry.
+    """
+    a = np.asarray(a, dtype=np.uint8)
+    b = np.asarray(b, dtype=np.uint8)
+
+    if a.ndim == 1:
+        width = max(len(a), len(b))
+        rows = np.zeros((2, width), dtype=np.uint8)
+        rows[0, :len(a)] = a
+        rows[1, :len(b)] = b
+        result = _add_rows(rows[:1], rows[1:])[0]
+        return result if result[-1] else result[:-1]
+
+    if a.shape != b.shape:
+        raise ValueError(f"shape mismatch: {a.shape} vs {b.shape}")
+    return _add_rows(a, b)
+
+
+def _add_rows(a, b):
+    """Add digit rows, resolving carries with a generate/propagate prefix scan.
+
+    A column generates a carry if its digit sum is >= 10 and propagates an
+    incoming one if the sum is exactly 9. The carry out of column i is the
+    generate bit of the nearest column j <= i that does not propagate, found
+    with a running maximum over column indices.
+    """
+    rows, width = a.shape
+    total = a + b
+    generate = total >= 10
+    propagate = total == 9
+
+    columns = np.where(propagate, -1, np.arange(width))
+    last = np.maximum.accumulate(columns, axis=1)
+    carry_out = np.take_along_axis(generate, np.maximum(last, 0), axis=1) & (last >= 0)
+
+    result = np.zeros((rows, width + 1), dtype=np.uint8)
+    result[:, :width] = total
+    result[:, 1:] += carry_out
+    result[:, :width] %= 10
+    return result
+
+
+if __name__ == "__main__":
+    print("Testing add_digit_arrays (digits in reverse order):")
+    print("-" * 60)
+
+    # 617 + 295 = 912
+    l1 = create_list([7, 1, 6])
+    l2 = create_list([5, 9, 2])
+    result = add_digit_arrays(list_to_array(l1), list_to_array(l2))
+    print(f"[7, 1, 6] + [5, 9, 2] = {array_to_list(result).to_list()} (represents 912)")
+
+    result = add_digit_arrays([9, 9, 9, 9, 9], [1])
+    print(f"[9, 9, 9, 9, 9] + [1] = {result.tolist()} (represents 100000)")
+
+    print("\n" + "=" * 60)
+    print("\nTesting batched 2-D addition:")
+    print("-" * 60)
+
+    rng = np.random.default_rng(3)
+    a = rng.integers(0, 10, size=(1000, 40), dtype=np.uint8)
+    b = rng.integers(0, 10, size=(1000, 40), dtype=np.uint8)
+    result = add_digit_arrays(a, b)
+
+    def value(row):
+        return int("".join(str(d) for d in row[::-1]))
+
+    matches = all(value(result[i]) == value(a[i]) + value(b[i]) for i in range(len(a)))
+    print(f"1000 pairs of 40-digit numbers: result shape {result.shape}, all match: {matches}")
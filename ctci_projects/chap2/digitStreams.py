@@ -0,0 +1,125 @@
+import io
+from itertools import chain, islice, repeat, zip_longest
+
+
+def read_digits(stream, chunk_size=1 << 16):
+    """Yield digits from a text stream of decimal characters, chunk_size chars per read.
+
+    Whitespace (e.g. line breaks) is skipped; any other character raises
+    ValueError.
+    """
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        for char in chunk:
+            if "0" <= char <= "9":
+                yield ord(char) - 48
+            elif not char.isspace():
+                raise ValueError(f"not a digit: {char!r}")
+
+
+def write_digits(stream, digits, chunk_size=1 << 16):
+    """Write digits from an iterable to a text stream, chunk_size digits per write."""
+    digits = iter(digits)
+    written = 0
+    while True:
+        chunk = "".join([chr(48 + digit) for digit in islice(digits, chunk_size)])
+        if not chunk:
+            return written
+        stream.write(chunk)
+        written += len(chunk)
+
+
+def add_digit_streams_reverse(digits1, digits2, base=10):
+    """Lazily add two digit iterables stored least significant first. O(1) memory.
+
+    Same result as sum_lists_reverse, one output digit per input column.
+    """
+    carry = 0
+    for val1, val2 in zip_longest(digits1, digits2, fillvalue=0):
+        total = val1 + val2 + carry
+        carry = total // base
+        yield total % base
+    if carry:
+        yield carry
+
+
+def add_digit_streams_forward(digits1, digits2, len1=None, len2=None, base=10):
+    """Lazily add two digit iterables stored most significant first. O(1) memory.
+
+    Forward order needs the columns aligned: pass both lengths to pad the
+    shorter stream with leading zeros, otherwise the streams must be the
+    same length (ValueError if they are not). A digit is emitted as soon as
+    no later carry can change it; only the count of a pending run of
+    (base - 1) digits is held back until a later column settles it.
+    """
+    if len1 is not None and len2 is not None:
+        digits1 = chain(repeat(0, max(0, len2 - len1)), digits1)
+        digits2 = chain(repeat(0, max(0, len1 - len2)), digits2)
+
+    top = base - 1
+    pending = None
+    nines = 0
+    for val1, val2 in zip(digits1, digits2, strict=True):
+        total = val1 + val2
+        if total == top:
+            nines += 1
+            continue
+
+        if total > top:
+            # Carry settles the run: pending rises by one, the nines roll over to 0
+            yield 1 if pending is None else pending + 1
+            fill = 0
+            total -= base
+        else:
+            if pending is not None:
+                yield pending
+            fill = top
+        for _ in range(nines):
+            yield fill
+        pending = total
+        nines = 0
+
+    if pending is not None:
+        yield pending
+    for _ in range(nines):
+        yield top
+
+
+if __name__ == "__main__":
+    print("Testing add_digit_streams_reverse:")
+    print("-" * 60)
+
+    # 617 + 295 = 912, digits least significant first
+    result = list(add_digit_streams_reverse([7, 1, 6], [5, 9, 2]))
+    print(f"[7, 1, 6] + [5, 9, 2] = {result} (represents 912)")
+    result = list(add_digit_streams_reverse(iter([9, 9, 9]), iter([1])))
+    print(f"[9, 9, 9] + [1] = {result} (represents 1000)")
+
+    print("\n" + "=" * 60)
+    print("\nTesting add_digit_streams_forward:")
+    print("-" * 60)
+
+    for digits1, digits2 in [([6, 1, 7], [2, 9, 5]), ([9, 9, 9], [1]),
+                             ([4, 9, 9, 3], [6, 8]), ([1, 4, 9, 9, 9], [0, 5, 0, 0, 1])]:
+        result = list(add_digit_streams_forward(iter(digits1), iter(digits2),
+                                                len(digits1), len(digits2)))
+        print(f"{digits1} + {digits2} = {result}")
+
+    try:
+        list(add_digit_streams_forward([1, 2], [3]))
+    except ValueError as e:
+        print(f"Unequal lengths without len1/len2: ValueError: {e}")
+
+    print("\n" + "=" * 60)
+    print("\nTesting file-backed streams:")
+    print("-" * 60)
+
+    file1 = io.StringIO("9" * 50 + "\n" + "1" * 50)
+    file2 = io.StringIO("0" * 99 + "1")
+    out = io.StringIO()
+    written = write_digits(out, add_digit_streams_forward(read_digits(file1, 16),
+                                                          read_digits(file2, 16)))
+    expected = str(int("9" * 50 + "1" * 50) + 1)
+    print(f"Wrote {written} digits, matches int sum: {out.getvalue() == expected}")
@@ -0,0 +1,96 @@
+from array import array
+
+from listNode import Node
+
+MASK64 = (1 << 64) - 1
+
+
+class IdentitySet:
+    """Set of objects compared by identity, stored as id() values in array('Q').
+
+    Open addressing with linear probing over 8-byte slots, kept at most two
+    thirds full, so an entry costs 12-24 bytes against 30-60 for a set of
+    objects. Only the ids are stored: objects must stay alive while they are
+    in the set, as the nodes of a list being walked do.
+    """
+
+    __slots__ = ("slots", "shift", "mask", "count")
+
+    def __init__(self, capacity=8):
+        size = 8
+        while size * 2 < capacity * 3:
+            size <<= 1
+        self._allocate(size)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, obj):
+        key = id(obj)
+        slots = self.slots
+        mask = self.mask
+        i = (((key >> 4) * 0x9E3779B97F4A7C15) & MASK64) >> self.shift
+        while True:
+            slot = slots[i]
+            if slot == key:
+                return True
+            if not slot:
+                return False
+            i = (i + 1) & mask
+
+    def add(self, obj):
+        """Add obj. Returns True if it was already present."""
+        key = id(obj)
+        slots = self.slots
+        mask = self.mask
+        i = (((key >> 4) * 0x9E3779B97F4A7C15) & MASK64) >> self.shift
+        while True:
+            slot = slots[i]
+            if slot == key:
+                return True
+            if not slot:
+                break
+            i = (i + 1) & mask
+
+        slots[i] = key
+        self.count += 1
+        if self.count * 3 > len(slots) * 2:
+            self._grow()
+        return False
+
+    def _allocate(self, size):
+        self.slots = array("Q", [0]) * size
+        self.shift = 64 - (size.bit_length() - 1)
+        self.mask = size - 1
+        self.count = 0
+
+    def _grow(self):
+        """Double the table and reinsert every id."""
+        old = self.slots
+        count = self.count
+        self._allocate(len(old) * 2)
+        slots = self.slots
+        mask = self.mask
+        shift = self.shift
+        for key in old:
+            if key:
+                i = (((key >> 4) * 0x9E3779B97F4A7C15) & MASK64) >> shift
+                while slots[i]:
+                    i = (i + 1) & mask
+                slots[i] = key
+        self.count = count
+
+
+if __name__ == "__main__":
+    print("Testing IdentitySet:")
+    print("-" * 60)
+
+    nodes = [Node(i % 3) for i in range(1000)]
+    visited = IdentitySet()
+    for node in nodes[:500]:
+        visited.add(node)
+    print(f"Added 500 nodes: len {len(visited)}, table size {len(visited.slots)}")
+    print(f"All added found: {all(node in visited for node in nodes[:500])}")
+    print(f"None of the rest found: {not any(node in visited for node in nodes[500:])}")
+    print(f"Re-adding reports present: {visited.add(nodes[0])}")
+    print(f"Equal data, different node: {Node(0) in visited}")
@@ -1,15 +1,16 @@
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
+from listNode import Node, guarded
 
 
-def find_intersection_hash(head1, head2):
-    """Find intersection using hash set. O(m+n) time, O(m) space."""
+def find_intersection_hash(head1, head2, visited_factory=set):
+    """Find intersection using hash set. O(m+n) time, O(m) space.
+
+    visited_factory builds the visited-node set; identitySet.IdentitySet
+    stores node ids in a flat array for far less memory than a set.
+    """
     if not head1 or not head2:
         return None
 
-    visited = set()
+    visited = visited_factory()
     current = head1
 
     # Add all nodes from first list to set
@@ -57,11 +58,52 @@ def find_intersection_aligned(head1, head2):
     return shorter
 
 
-def get_length_and_tail(head):
-    """Get length and tail node of list."""
+def find_common_intersection(heads):
+    """Find the node where all K lists merge. O(total length) time, O(K) space.
+
+    Every list's length and tail are computed once; differing tails mean
+    no common node. The cursors are then aligned to the shortest list and
+    advanced in lockstep until they all point at the same node.
+    """
+    if not heads or any(not head for head in heads):
+        return None
+
+    lengths = []
+    tail = None
+    for head in heads:
+        length, list_tail = get_length_and_tail(head)
+        if tail is None:
+            tail = list_tail
+        elif list_tail is not tail:
+            return None
+        lengths.append(length)
+
+    shortest = min(lengths)
+    cursors = []
+    for head, length in zip(heads, lengths):
+        for _ in range(length - shortest):
+            head = head.next
+        cursors.append(head)
+
+    while True:
+        first = cursors[0]
+        if all(cursor is first for cursor in cursors):
+            return first
+        for i in range(len(cursors)):
+            cursors[i] = cursors[i].next
+
+
+def get_length_and_tail(head, guard=False):
+    """Get length and tail node of list. guard=True raises CycleDetected on a loop."""
     if not head:
         return 0, None
 
+    if guard:
+        length = 0
+        for tail in guarded(head):
+            length += 1
+        return length, tail
+
     length = 0
     current = head
     while current:
@@ -230,3 +272,38 @@ if __name__ == "__main__":
     print(f"{match} Hash result: {result_hash.data if result_hash else None}")
     print(f"{match} Aligned result: {result_aligned.data if result_aligned else None}")
     print(f"Both methods agree: {result_hash == result_aligned}")
+
+    print("\n" + "=" * 60)
+    print("\nTesting find_common_intersection:")
+    print("-" * 60)
+
+    # Three chains merge at X; a fourth joins the shared tail later at Y
+    nodeX = Node('X')
+    nodeY = Node('Y')
+    nodeZ = Node('Z')
+    nodeX.next = nodeY
+    nodeY.next = nodeZ
+
+    heads = [Node('A'), Node('D'), Node('F'), Node('H')]
+    heads[0].next = Node('B')
+    heads[0].next.next = Node('C')
+    heads[0].next.next.next = nodeX
+    heads[1].next = Node('E')
+    heads[1].next.next = nodeX
+    heads[2].next = nodeX
+    heads[3].next = nodeY
+
+    for head in heads:
+        print(f"List: {get_values(head)}")
+    result = find_common_intersection(heads[:3])
+    print(f"Common intersection of first three: {result.data if result else None}")
+    print(f"Expected: X")
+    result = find_common_intersection(heads)
+    print(f"Common intersection of all four: {result.data if result else None}")
+    print(f"Expected: Y")
+
+    other = Node('Q')
+    other.next = Node('R')
+    result = find_common_intersection(heads + [other])
+    print(f"With a disjoint list: {result.data if result else None}")
+    print(f"Expected: None")
@@ -0,0 +1,155 @@
+from array import array
+
+from intersection import find_intersection_aligned, get_values
+from listNode import Node
+
+
+class IntersectionIndex:
+    """Binary-lifting index over acyclic lists that share tails.
+
+    Lists that share tails form an in-tree whose roots are the tail nodes:
+    a node's parent is its next node and its depth is its distance to the
+    tail. Where two lists meet is the lowest common ancestor of their heads,
+    answered in O(log n) with up[j][i], the 2**j-th successor of node i.
+    Building is O(n log n); adding a list only indexes its new nodes, so a
+    freshly prepended head costs O(log n).
+    """
+
+    def __init__(self, heads=()):
+        self.index = {}
+        self.nodes = []
+        self.depth = array("q")
+        self.up = [array("q")]
+        self.heads = []
+        for head in heads:
+            self.add_list(head)
+
+    def __len__(self):
+        return len(self.heads)
+
+    def add_list(self, head):
+        """Index the list at head and return its list number for intersection()."""
+        self._index_chain(head)
+        self.heads.append(head)
+        return len(self.heads) - 1
+
+    def prepend(self, list_number, data):
+        """Prepend a new head to an indexed list. O(log n). Returns the new node."""
+        node = Node(data)
+        node.next = self.heads[list_number]
+        self.heads[list_number] = node
+        self._index_chain(node)
+        return node
+
+    def intersection(self, i, j):
+        """Node where lists i and j meet, or None. O(log n)."""
+        return self.meet(self.heads[i], self.heads[j])
+
+    def meet(self, node1, node2):
+        """First node shared by the lists starting at two indexed nodes, or None."""
+        if node1 is None or node2 is None:
+            return None
+        a = self.index[node1]
+        b = self.index[node2]
+        depth = self.depth
+        up = self.up
+
+        if depth[a] < depth[b]:
+            a, b = b, a
+        diff = depth[a] - depth[b]
+        level = 0
+        while diff:
+            if diff & 1:
+                a = up[level][a]
+            diff >>= 1
+            level += 1
+
+        if a == b:
+            return self.nodes[a]
+
+        for level in reversed(up):
+            if level[a] != level[b]:
+                a = level[a]
+                b = level[b]
+
+        parent = up[0][a]
+        return self.nodes[parent] if parent != -1 else None
+
+    def _index_chain(self, head):
+        """Index the nodes from head up to the first already indexed node."""
+        index = self.index
+        new_nodes = []
+        n = head
+        while n is not None and n not in index:
+            new_nodes.append(n)
+            n = n.next
+
+        base = self.depth[index[n]] + 1 if n is not None else 0
+        self._ensure_levels(base + len(new_nodes) - 1)
+
+        depth = self.depth
+        up = self.up
+        # Successors first, so every jump target already has its entries
+        for node in reversed(new_nodes):
+            index[node] = len(self.nodes)
+            self.nodes.append(node)
+            if node.next is None:
+                depth.append(0)
+                parent = -1
+            else:
+                parent = index[node.next]
+                depth.append(depth[parent] + 1)
+            up[0].append(parent)
+            for level in range(1, len(up)):
+                if parent != -1:
+                    parent = up[level - 1][parent]
+                up[level].append(parent)
+
+    def _ensure_levels(self, max_depth):
+        """Add jump levels until 2**levels exceeds max_depth. O(n) per new level."""
+        up = self.up
+        while (1 << len(up)) <= max_depth:
+            prev = up[-1]
+            up.append(array("q", (prev[p] if p != -1 else -1 for p in prev)))
+
+
+if __name__ == "__main__":
+    print("Testing IntersectionIndex:")
+    print("-" * 60)
+
+    # Trunk T1 -> T2 -> T3 with branches joining at different depths
+    trunk = Node('T1')
+    trunk.next = Node('T2')
+    trunk.next.next = Node('T3')
+
+    def branch(values, join):
+        head = Node(values[0])
+        current = head
+        for value in values[1:]:
+            current.next = Node(value)
+            current = current.next
+        current.next = join
+        return head
+
+    heads = [
+        branch(['A', 'B'], trunk),
+        branch(['C'], trunk.next),
+        branch(['D', 'E', 'F'], trunk),
+    ]
+    heads.append(branch(['G'], heads[2].next))
+    separate = branch(['X', 'Y'], None)
+
+    index = IntersectionIndex(heads + [separate])
+    for i in range(len(index)):
+        print(f"List {i}: {get_values(index.heads[i])}")
+
+    for i, j in [(0, 1), (0, 2), (2, 3), (1, 3), (0, 4)]:
+        result = index.intersection(i, j)
+        expected = find_intersection_aligned(index.heads[i], index.heads[j])
+        status = "✓" if result is expected else "✗"
+        print(f"{status} lists {i} and {j} meet at: {result.data if result else None}")
+
+    index.prepend(1, 'P')
+    print(f"\nAfter prepend to list 1: {get_values(index.heads[1])}")
+    result = index.intersection(1, 3)
+    print(f"Lists 1 and 3 meet at: {result.data if result else None}")
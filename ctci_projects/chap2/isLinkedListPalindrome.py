@@ -1,15 +1,6 @@
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
-
-    def to_list(self):
-        result = []
-        n = self
-        while n is not None:
-            result.append(n.data)
-            n = n.next
-        return result
+import random
+
+from listNode import Node
 
 
 def is_palindrome_stack(head):
@@ -87,16 +78,134 @@ def is_palindrome_runner(head):
     return True
 
 
+def is_palindrome_inplace(head):
+    """Check if palindrome by reversing the second half in place. O(n) time, O(1) space.
+
+    The second half is reversed back before returning, so the list is left
+    exactly as it was; it must not be read or relinked concurrently.
+    """
+    if not head or not head.next:
+        return True
+
+    # Stop slow at the end of the first half (the middle if odd length)
+    slow = fast = head
+    while fast.next and fast.next.next:
+        slow = slow.next
+        fast = fast.next.next
+
+    second = reverse_in_place(slow.next)
+    is_palindrome = True
+    left, right = head, second
+    while right:
+        if left.data != right.data:
+            is_palindrome = False
+            break
+        left = left.next
+        right = right.next
+
+    slow.next = reverse_in_place(second)
+    return is_palindrome
+
+
+def reverse_in_place(head):
+    """Reverse a list by relinking its nodes. Returns the new head."""
+    prev = None
+    while head:
+        next_node = head.next
+        head.next = prev
+        prev = head
+        head = next_node
+    return prev
+
+
+class PalindromeStream:
+    """Online "is the prefix so far a palindrome?" check. O(1) time per value, O(1) space.
+
+    Compares forward and reverse rolling hashes under two random-base
+    moduli. Non-int values are reduced with hash(), so equal hashes count as equal.
+    """
+
+    MOD1 = (1 << 61) - 1
+    MOD2 = (1 << 31) - 1
+
+    __slots__ = ("base1", "base2", "salt1", "salt2", "forward1", "forward2",
+                 "reverse1", "reverse2", "power1", "power2", "length")
+
+    def __init__(self, values=()):
+        self.base1 = random.randrange(256, self.MOD1 - 1)
+        self.base2 = random.randrange(256, self.MOD2 - 1)
+        self.salt1 = random.randrange(256, self.MOD1 - 1)
+        self.salt2 = random.randrange(256, self.MOD2 - 1)
+        self.forward1 = self.forward2 = 0
+        self.reverse1 = self.reverse2 = 0
+        self.power1 = self.power2 = 1
+        self.length = 0
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return self.length
+
+    def append(self, value):
+        """Add the next value. Returns whether the prefix is now a palindrome."""
+        key1, key2 = self._keys(value)
+        mod1 = self.MOD1
+        mod2 = self.MOD2
+        # Forward reading shifts the old prefix up; reverse reading adds at the top
+        self.forward1 = (self.forward1 * self.base1 + key1) % mod1
+        self.forward2 = (self.forward2 * self.base2 + key2) % mod2
+        self.reverse1 = (self.reverse1 + key1 * self.power1) % mod1
+        self.reverse2 = (self.reverse2 + key2 * self.power2) % mod2
+        self.power1 = self.power1 * self.base1 % mod1
+        self.power2 = self.power2 * self.base2 % mod2
+        self.length += 1
+        return self.forward1 == self.reverse1 and self.forward2 == self.reverse2
+
+    def _keys(self, value):
+        """Reduce value to one key per modulus by folding salted limbs below each."""
+        # hash(-1) == hash(-2), so ints go in as they are
+        if type(value) is not int:
+            value = hash(value)
+        z = value << 1 if value >= 0 else ~value << 1 | 1
+        if z < 1 << 30:
+            return z, z
+
+        keys = []
+        for mod, salt, bits in ((self.MOD1, self.salt1, 60), (self.MOD2, self.salt2, 30)):
+            mask = (1 << bits) - 1
+            key = 0
+            power = 1
+            rest = z
+            while rest:
+                key = (key + (rest & mask) * power) % mod
+                power = power * salt % mod
+                rest >>= bits
+            keys.append(key)
+        return keys
+
+    def is_palindrome(self, head=None):
+        """Whether the prefix is a palindrome, by hash.
+
+        Pass the head of a list holding exactly the values appended so far
+        to confirm a positive answer with is_palindrome_inplace.
+        """
+        if self.forward1 != self.reverse1 or self.forward2 != self.reverse2:
+            return False
+        return head is None or is_palindrome_inplace(head)
+
+
 class Result:
+    __slots__ = ("node", "is_palindrome")
+
     def __init__(self, node, is_palindrome):
         self.node = node
         self.is_palindrome = is_palindrome
 
 
 def is_palindrome_recursive(head):
-    """Check if palindrome recursively. O(n) time and space."""
+    """Check if palindrome by unwinding an explicit stack. O(n) time and space."""
     length = get_length(head)
-    result = check_palindrome(head, length)
+    result = check_palindrome_iterative(head, length)
     return result.is_palindrome
 
 
@@ -108,8 +217,26 @@ def get_length(head):
     return length
 
 
+def check_palindrome_iterative(head, length):
+    """check_palindrome with the call stack replaced by a list of nodes."""
+    stack = []
+    while length > 1:
+        stack.append(head)
+        head = head.next
+        length -= 2
+
+    result = Result(head if length == 0 else head.next, True)
+    while stack:
+        head = stack.pop()
+        if not result.is_palindrome or result.node is None:
+            continue
+        result = Result(result.node.next, head.data == result.node.data)
+
+    return result
+
+
 def check_palindrome(head, length):
-    """Returns Result with corresponding node and palindrome status."""
+    """Returns Result with corresponding node and palindrome status. Recurses once per pair."""
     if length == 0:
         return Result(head, True)
     if length == 1:
@@ -182,6 +309,16 @@ if __name__ == "__main__":
         status = "✓" if result == expected else "✗"
         print(f"{status} {values}: {result} (expected: {expected})")
 
+    print("\n" + "=" * 60)
+    print("\nTesting is_palindrome_inplace:")
+    print("-" * 60)
+    for values, expected in test_cases:
+        head = create_list(values)
+        result = is_palindrome_inplace(head)
+        restored = (head.to_list() if head else []) == values
+        status = "✓" if result == expected and restored else "✗"
+        print(f"{status} {values}: {result} (expected: {expected}, restored: {restored})")
+
     print("\n" + "=" * 60)
     print("\nTesting is_palindrome_recursive:")
     print("-" * 60)
@@ -190,3 +327,19 @@ if __name__ == "__main__":
         result = is_palindrome_recursive(head)
         status = "✓" if result == expected else "✗"
         print(f"{status} {values}: {result} (expected: {expected})")
+
+    print("\n" + "=" * 60)
+    print("\nTesting PalindromeStream (prefixes of a stream):")
+    print("-" * 60)
+    stream = PalindromeStream()
+    head = tail = None
+    for value in ['R', 'A', 'C', 'E', 'C', 'A', 'R', 'R']:
+        hashed = stream.append(value)
+        if head is None:
+            head = tail = Node(value)
+        else:
+            tail.next = Node(value)
+            tail = tail.next
+        expected = is_palindrome_inplace(head)
+        status = "✓" if hashed == expected == stream.is_palindrome(head) else "✗"
+        print(f"{status} prefix {head.to_list()}: {hashed} (expected: {expected})")
@@ -0,0 +1,175 @@
+from SumLists import create_list
+
+# Below this many digits multiply_lists switches to schoolbook multiplication
+KARATSUBA_THRESHOLD = 48
+
+
+def multiply_lists(l1, l2, forward=False, threshold=KARATSUBA_THRESHOLD):
+    """Multiply two digit lists. O(n^1.585) time above threshold, O(n·m) below.
+
+    Lists are in reverse (least significant digit first) order unless
+    forward=True, as produced by create_list. Returns a new list in the
+    same order without leading zeros.
+    """
+    a = _to_digits(l1, forward)
+    b = _to_digits(l2, forward)
+    if not a or not b:
+        return _from_digits([0], forward)
+    return _from_digits(_normalize(_karatsuba(a, b, max(2, threshold))), forward)
+
+
+def subtract_lists(l1, l2, forward=False):
+    """Subtract digit list l2 from l1 (l1 must be >= l2). O(n) time.
+
+    Raises ValueError if the difference would be negative.
+    """
+    a = _to_digits(l1, forward)
+    b = _to_digits(l2, forward)
+    if _compare_digits(a, b) < 0:
+        raise ValueError("subtract_lists requires l1 >= l2")
+
+    result = []
+    borrow = 0
+    for i in range(len(a)):
+        digit = a[i] - borrow - (b[i] if i < len(b) else 0)
+        borrow = 1 if digit < 0 else 0
+        result.append(digit + 10 * borrow)
+    return _from_digits(_strip(result), forward)
+
+
+def compare_lists(l1, l2, forward=False):
+    """Compare the numbers two digit lists represent. Returns -1, 0 or 1."""
+    return _compare_digits(_to_digits(l1, forward), _to_digits(l2, forward))
+
+
+def _to_digits(head, forward):
+    """Digits of a list, least significant first, without leading zeros."""
+    digits = head.to_list() if head is not None else []
+    if forward:
+        digits.reverse()
+    return _strip(digits)
+
+
+def _from_digits(digits, forward):
+    """Build a list from least-significant-first digits in the requested order."""
+    if forward:
+        digits = digits[::-1]
+    return create_list(digits)
+
+
+def _strip(digits):
+    """Drop most significant zeros, keeping a single 0 for zero."""
+    while len(digits) > 1 and digits[-1] == 0:
+        digits.pop()
+    return digits
+
+
+def _compare_digits(a, b):
+    """Compare stripped least-significant-first digit lists."""
+    if len(a) != len(b):
+        return -1 if len(a) < len(b) else 1
+    for i in range(len(a) - 1, -1, -1):
+        if a[i] != b[i]:
+            return -1 if a[i] < b[i] else 1
+    return 0
+
+
+def _karatsuba(a, b, threshold):
+    """Multiply coefficient lists as polynomials; carries are left unresolved."""
+    if len(a) < threshold or len(b) < threshold:
+        return _schoolbook(a, b)
+
+    m = max(len(a), len(b)) // 2
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+    if not a1 or not b1:
+        return _schoolbook(a, b)
+
+    z0 = _karatsuba(a0, b0, threshold)
+    z2 = _karatsuba(a1, b1, threshold)
+    z1 = _karatsuba(_poly_add(a0, a1), _poly_add(b0, b1), threshold)
+
+    result = [0] * max(len(a) + len(b), m + len(z1))
+    for i, c in enumerate(z0):
+        result[i] += c
+        result[i + m] -= c
+    for i, c in enumerate(z2):
+        result[i + 2 * m] += c
+        result[i + m] -= c
+    for i, c in enumerate(z1):
+        result[i + m] += c
+    return result
+
+
+def _schoolbook(a, b):
+    """Multiply coefficient lists as polynomials. O(len(a) * len(b))."""
+    result = [0] * (len(a) + len(b))
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def _poly_add(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    result = a[:]
+    for i, y in enumerate(b):
+        result[i] += y
+    return result
+
+
+def _normalize(coefficients):
+    """Resolve carries in non-negative coefficients to base-10 digits."""
+    digits = []
+    carry = 0
+    for c in coefficients:
+        carry, digit = divmod(c + carry, 10)
+        digits.append(digit)
+    while carry:
+        carry, digit = divmod(carry, 10)
+        digits.append(digit)
+    return _strip(digits)
+
+
+if __name__ == "__main__":
+    print("Testing multiply_lists (digits in reverse order):")
+    print("-" * 60)
+
+    # (7->1->6) * (5->9->2) = 617 * 295 = 182015
+    l1 = create_list([7, 1, 6])
+    l2 = create_list([5, 9, 2])
+    result = multiply_lists(l1, l2)
+    print(f"617 * 295: {result.to_list()} (represents 182015)")
+
+    l1 = create_list([int(c) for c in reversed(str(3**200))])
+    l2 = create_list([int(c) for c in reversed(str(7**150))])
+    result = multiply_lists(l1, l2, threshold=8)
+    product = int("".join(str(d) for d in reversed(result.to_list())))
+    print(f"3**200 * 7**150 with Karatsuba: {product == 3**200 * 7**150}")
+
+    l1 = create_list([6, 1, 7])
+    l2 = create_list([0, 0])
+    print(f"617 * 00 (forward): {multiply_lists(l1, l2, forward=True).to_list()}")
+
+    print("\n" + "=" * 60)
+    print("\nTesting subtract_lists and compare_lists (forward order):")
+    print("-" * 60)
+
+    l1 = create_list([1, 0, 0, 0])
+    l2 = create_list([1])
+    print(f"1000 - 1: {subtract_lists(l1, l2, forward=True).to_list()} (represents 999)")
+
+    l1 = create_list([6, 1, 7])
+    l2 = create_list([6, 1, 7])
+    print(f"617 - 617: {subtract_lists(l1, l2, forward=True).to_list()} (represents 0)")
+
+    for digits1, digits2 in [([6, 1, 7], [2, 9, 5]), ([0, 9], [1, 0]), ([4, 2], [0, 4, 2])]:
+        result = compare_lists(create_list(digits1), create_list(digits2), forward=True)
+        print(f"compare {digits1} vs {digits2}: {result}")
+
+    try:
+        subtract_lists(create_list([1]), create_list([2]), forward=True)
+    except ValueError as e:
+        print(f"1 - 2: ValueError: {e}")
@@ -0,0 +1,117 @@
+from itertools import islice
+
+
+class CycleDetected(Exception):
+    """Raised by a guarded traversal that runs into a loop.
+
+    entry is the first node of the loop, as find_loop_start would return.
+    """
+
+    def __init__(self, entry):
+        super().__init__(f"list loops back to node with data {entry.data!r}")
+        self.entry = entry
+
+    @classmethod
+    def from_head(cls, head):
+        """Build the error for a list known to loop, locating its entry. O(μ + λ)."""
+        # Brent: λ from the first meeting, then pointers λ apart meet at the entry
+        power = cycle_length = 1
+        tortoise, hare = head, head.next
+        while tortoise is not hare:
+            if power == cycle_length:
+                tortoise = hare
+                power *= 2
+                cycle_length = 0
+            hare = hare.next
+            cycle_length += 1
+
+        tortoise = hare = head
+        for _ in range(cycle_length):
+            hare = hare.next
+        while tortoise is not hare:
+            tortoise = tortoise.next
+            hare = hare.next
+        return cls(tortoise)
+
+
+def guarded(head):
+    """Yield the nodes from head, raising CycleDetected if the list loops. O(1) space.
+
+    Brent's check runs in the same pass: a parked pointer moves up to the
+    walk at every power of two steps, and the walk running into it again
+    means a loop. Acyclic lists pay one identity test per node; the entry is
+    only located once a loop is found.
+    """
+    if head is None:
+        return
+    parked = n = head
+    power = 1
+    while True:
+        for _ in range(power):
+            yield n
+            n = n.next
+            if n is None:
+                return
+            if n is parked:
+                raise CycleDetected.from_head(head)
+        parked = n
+        power *= 2
+
+
+class Node:
+    """Singly linked list node shared by the chap2 modules.
+
+    __slots__ drops the per-instance __dict__, so each node costs a fixed
+    two-pointer object and .data/.next lookups skip the dict. Subclasses
+    that only add methods should declare __slots__ = () to keep that.
+    """
+
+    __slots__ = ("data", "next")
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+    def to_list(self, guard=False):
+        """Convert linked list to Python list.
+
+        With guard=True a cyclic list raises CycleDetected instead of
+        growing the result forever.
+        """
+        if guard:
+            return [n.data for n in guarded(self)]
+        result = []
+        n = self
+        while n is not None:
+            result.append(n.data)
+            n = n.next
+        return result
+
+    def __iter__(self):
+        n = self
+        while n is not None:
+            yield n.data
+            n = n.next
+
+    def iter_slice(self, start, stop=None, step=1):
+        """Lazily yield values like list[start:stop:step], without building the list."""
+        return islice(self, start, stop, step)
+
+    def write_to(self, stream, chunk_size=1024, sep=" -> ", guard=False):
+        """Write values to a text stream, joined by sep, chunk_size values per write.
+
+        Only one chunk of strings is alive at a time, so dumping a list of
+        any length runs in constant memory. Returns the number of values
+        written. With guard=True a cyclic list raises CycleDetected once the
+        loop is found; the chunks before it have already been written.
+        """
+        values = (n.data for n in guarded(self)) if guard else iter(self)
+        written = 0
+        while True:
+            chunk = [str(value) for value in islice(values, chunk_size)]
+            if not chunk:
+                return written
+            if written:
+                stream.write(sep)
+            stream.write(sep.join(chunk))
+            written += len(chunk)
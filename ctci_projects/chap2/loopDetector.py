@@ -1,7 +1,4 @@
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None
+from listNode import Node
 
 
 def find_loop_start(head):
@@ -31,9 +28,62 @@ def find_loop_start(head):
     return fast
 
 
-def find_loop_start_hash(head):
-    """Find loop start using hash set. O(n) time, O(n) space."""
-    seen = set()
+class LoopInfo:
+    """Loop metadata: entry node, tail length μ and cycle length λ."""
+
+    __slots__ = ("entry", "tail_length", "cycle_length")
+
+    def __init__(self, entry, tail_length, cycle_length):
+        self.entry = entry
+        self.tail_length = tail_length
+        self.cycle_length = cycle_length
+
+
+def find_loop_brent(head):
+    """Find loop using Brent's algorithm. O(μ + λ) time, O(1) space.
+
+    The tortoise jumps to the hare at every power of two, so the first
+    meeting gives λ directly; a second pass with the pointers λ apart finds
+    the entry and μ. Returns LoopInfo, or None if there is no loop.
+    """
+    if not head:
+        return None
+
+    # Each round the hare takes up to `power` steps from the parked tortoise
+    power = 1
+    tortoise = hare = head
+    while True:
+        for cycle_length in range(1, power + 1):
+            hare = hare.next
+            if hare is None:
+                return None
+            if hare is tortoise:
+                break
+        else:
+            tortoise = hare
+            power *= 2
+            continue
+        break
+
+    # Start the hare λ nodes ahead; the pointers meet at the loop entry
+    tortoise = hare = head
+    for _ in range(cycle_length):
+        hare = hare.next
+    tail_length = 0
+    while tortoise is not hare:
+        tortoise = tortoise.next
+        hare = hare.next
+        tail_length += 1
+
+    return LoopInfo(tortoise, tail_length, cycle_length)
+
+
+def find_loop_start_hash(head, visited_factory=set):
+    """Find loop start using hash set. O(n) time, O(n) space.
+
+    visited_factory builds the seen-node set, e.g. identitySet.IdentitySet.
+    """
+    seen = visited_factory()
     current = head
 
     while current:
@@ -45,12 +95,12 @@ def find_loop_start_hash(head):
     return None
 
 
-def create_loop_list(values, loop_index):
+def create_loop_list(values, loop_index, node_class=Node):
     """Helper to create linked list with loop at given index."""
     if not values:
         return None
 
-    nodes = [Node(val) for val in values]
+    nodes = [node_class(val) for val in values]
 
     for i in range(len(nodes) - 1):
         nodes[i].next = nodes[i + 1]
@@ -144,6 +194,20 @@ if __name__ == "__main__":
     result = find_loop_start_hash(head)
     print(f"Loop start: {result.data if result else None}")
 
+    print("\n" + "=" * 60)
+    print("\nTesting find_loop_brent:")
+    print("-" * 60)
+
+    for values, loop_idx in [(['A', 'B', 'C', 'D', 'E'], 2), ([1, 2, 3, 4], 0),
+                             ([5, 6, 7], 2), ([1, 2, 3], None)]:
+        head = create_loop_list(values, loop_idx)
+        info = find_loop_brent(head)
+        if info:
+            print(f"{values} loop at {loop_idx}: entry {info.entry.data}, "
+                  f"μ={info.tail_length}, λ={info.cycle_length}")
+        else:
+            print(f"{values} loop at {loop_idx}: no loop")
+
     print("\n" + "=" * 60)
     print("\nTest cases comparison:")
     print("-" * 60)
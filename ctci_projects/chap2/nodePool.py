@@ -0,0 +1,183 @@
+from listNode import Node
+from loopDetector import find_loop_start
+
+NIL = -1
+
+
+class PoolNode(Node):
+    """Node owned by a NodePool; index is its slot in the pool's arrays."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, data, index):
+        super().__init__(data)
+        self.index = index
+
+
+class NodePool:
+    """Nodes rewired through set_next, which reports loops. O(log n) amortized per call.
+
+    Each group is a link-cut tree rooted at its last node; roots whose next
+    closes a loop are kept in closing. Only assign .next through set_next.
+    """
+
+    def __init__(self):
+        self.nodes = []
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.closing = set()
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def new_node(self, data):
+        """Create an unlinked node in the pool."""
+        node = PoolNode(data, len(self.nodes))
+        self.nodes.append(node)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.parent.append(NIL)
+        return node
+
+    def create_list(self, values, loop_index=None):
+        """Create a list from values, looping back to loop_index like create_loop_list."""
+        nodes = [self.new_node(value) for value in values]
+        for node, next_node in zip(nodes, nodes[1:]):
+            self.set_next(node, next_node)
+        if nodes and loop_index is not None:
+            self.set_next(nodes[-1], nodes[loop_index])
+        return nodes[0] if nodes else None
+
+    def set_next(self, a, b):
+        """Point a.next at b (a pool node or None). O(log n) amortized.
+
+        Returns True if the new link closes a loop.
+        """
+        i = a.index
+        closing = self.closing
+        if i in closing:
+            closing.discard(i)
+        elif a.next is not None:
+            root = self._find_root(i)
+            self._cut(i)
+            if root in closing:
+                # The loop ran through a's old link iff its target is now under a
+                target = self.nodes[root].next.index
+                if self._find_root(target) == i:
+                    closing.discard(root)
+                    self._link(root, target)
+
+        a.next = b
+        if b is None:
+            return False
+        if self._find_root(b.index) == i:
+            closing.add(i)
+            return True
+        self._link(i, b.index)
+        return False
+
+    def reaches_loop(self, node):
+        """True if following next from node runs into a loop. O(log n) amortized."""
+        return self._find_root(node.index) in self.closing
+
+    def _is_splay_root(self, x):
+        p = self.parent[x]
+        return p == NIL or (self.left[p] != x and self.right[p] != x)
+
+    def _rotate(self, x):
+        left = self.left
+        right = self.right
+        parent = self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_splay_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+
+        if left[p] == x:
+            child = right[x]
+            left[p] = child
+            right[x] = p
+        else:
+            child = left[x]
+            right[p] = child
+            left[x] = p
+        if child != NIL:
+            parent[child] = p
+        parent[p] = x
+
+    def _splay(self, x):
+        left = self.left
+        parent = self.parent
+        while not self._is_splay_root(x):
+            p = parent[x]
+            if not self._is_splay_root(p):
+                g = parent[p]
+                # Zig-zig rotates the parent first, zig-zag the node twice
+                self._rotate(p if (left[g] == p) == (left[p] == x) else x)
+            self._rotate(x)
+
+    def _access(self, x):
+        """Make the path from x to its tree root preferred and splay x to its top."""
+        right = self.right
+        last = NIL
+        y = x
+        while y != NIL:
+            self._splay(y)
+            right[y] = last
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _find_root(self, x):
+        """Index of the root of x's tree: the last node before None or the closing link."""
+        self._access(x)
+        left = self.left
+        while left[x] != NIL:
+            x = left[x]
+        self._splay(x)
+        return x
+
+    def _link(self, child, parent):
+        """Hang the tree rooted at child under parent (different trees)."""
+        self._access(child)
+        self.parent[child] = parent
+
+    def _cut(self, x):
+        """Detach x (not a tree root) from its tree parent."""
+        self._access(x)
+        self.parent[self.left[x]] = NIL
+        self.left[x] = NIL
+
+
+if __name__ == "__main__":
+    print("Testing NodePool.set_next:")
+    print("-" * 60)
+
+    pool = NodePool()
+    head = pool.create_list(['A', 'B', 'C', 'D', 'E'])
+    nodes = {node.data: node for node in pool.nodes}
+    print(f"List: {head.to_list()}")
+
+    rewires = [('E', 'C'), ('E', None), ('B', 'D'), ('D', 'A'), ('C', 'E'), ('A', 'C'), ('D', 'B')]
+    for a, b in rewires:
+        closed = pool.set_next(nodes[a], nodes[b] if b else None)
+        loops = pool.reaches_loop(head)
+        expected = find_loop_start(head) is not None
+        status = "✓" if loops == expected else "✗"
+        print(f"{status} {a}.next = {b}: closes loop {closed}, head reaches loop {loops}")
+
+    print("\n" + "=" * 60)
+    print("\nTesting create_list with loop_index:")
+    print("-" * 60)
+
+    pool = NodePool()
+    looped = pool.create_list(range(6), loop_index=2)
+    plain = pool.create_list(range(4))
+    print(f"Looping list reaches loop: {pool.reaches_loop(looped)}, "
+          f"entry {find_loop_start(looped).data}")
+    print(f"Plain list reaches loop: {pool.reaches_loop(plain)}")
@@ -0,0 +1,126 @@
+import numpy as np
+
+from loopDetector import create_loop_list, find_loop_brent
+
+
+class CycleLabels:
+    """Per-index cycle structure of a successor array.
+
+    tail_length[i] is the number of steps from i to its cycle entry (0 on a
+    cycle), or the number of nodes from i to the end if i reaches -1.
+    cycle_id[i] is the smallest index on i's cycle, cycle_entry[i] the
+    first cycle node i reaches and cycle_length[i] that cycle's length;
+    they are -1, -1 and 0 for indices that reach the end.
+    """
+
+    __slots__ = ("tail_length", "cycle_id", "cycle_entry", "cycle_length")
+
+    def __init__(self, tail_length, cycle_id, cycle_entry, cycle_length):
+        self.tail_length = tail_length
+        self.cycle_id = cycle_id
+        self.cycle_entry = cycle_entry
+        self.cycle_length = cycle_length
+
+
+def analyze_successors(successors):
+    """Label every index of a successor array (-1 = end) by pointer doubling.
+
+    O(n log n) work in O(log n) NumPy passes. Returns CycleLabels.
+    """
+    succ = np.asarray(successors, dtype=np.int64)
+    n = len(succ)
+    # The end is a sink that points to itself; f**(2**rounds) lands every index on a cycle
+    sink = n
+    step = np.append(np.where(succ >= 0, succ, sink), sink)
+    rounds = (n + 1).bit_length()
+
+    jump = step
+    for _ in range(rounds):
+        jump = jump[jump]
+    on_cycle = np.zeros(n + 1, dtype=bool)
+    on_cycle[jump] = True
+
+    entry = np.where(on_cycle, np.arange(n + 1), step)
+    tail_length = (~on_cycle).astype(np.int64)
+    for _ in range(rounds):
+        tail_length += tail_length[entry]
+        entry = entry[entry]
+
+    # Smallest index on each cycle: after k rounds label[i] is the minimum
+    # over the 2**k nodes starting at i, which covers any cycle
+    label = np.arange(n + 1)
+    jump = step
+    covered = 1
+    while covered < np.count_nonzero(on_cycle):
+        label = np.minimum(label, label[jump])
+        jump = jump[jump]
+        covered *= 2
+    cycle_length = np.bincount(label[on_cycle], minlength=n + 1)
+
+    ends = entry[:n] == sink
+    cycle_entry = np.where(ends, -1, entry[:n])
+    cycle_id = np.where(ends, -1, label[entry[:n]])
+    cycle_length = np.where(ends, 0, cycle_length[label[entry[:n]]])
+    return CycleLabels(tail_length[:n], cycle_id, cycle_entry, cycle_length)
+
+
+def nodes_to_successors(heads):
+    """Convert Node chains (possibly cyclic or sharing nodes) to a successor array.
+
+    Returns (successors, nodes, head_indices): successors[i] is the index of
+    nodes[i].next or -1, and head_indices[k] is the index of heads[k].
+    """
+    index = {}
+    nodes = []
+    successors = []
+    head_indices = []
+    for head in heads:
+        n = head
+        while n is not None and n not in index:
+            index[n] = len(nodes)
+            nodes.append(n)
+            successors.append(-1)
+            n = n.next
+        head_indices.append(index[head] if head is not None else -1)
+
+    for i, node in enumerate(nodes):
+        if node.next is not None:
+            successors[i] = index[node.next]
+    return np.array(successors, dtype=np.int64), nodes, head_indices
+
+
+if __name__ == "__main__":
+    print("Testing analyze_successors:")
+    print("-" * 60)
+
+    # 0 -> 1 -> 2 -> 3 -> 1 (cycle 1,2,3), 4 -> 2, 5 -> 6 -> end, 7 -> 7
+    successors = [1, 2, 3, 1, 2, 6, -1, 7]
+    labels = analyze_successors(successors)
+    print(f"successors:   {successors}")
+    print(f"tail_length:  {labels.tail_length.tolist()}")
+    print(f"cycle_id:     {labels.cycle_id.tolist()}")
+    print(f"cycle_entry:  {labels.cycle_entry.tolist()}")
+    print(f"cycle_length: {labels.cycle_length.tolist()}")
+
+    print("\n" + "=" * 60)
+    print("\nTesting nodes_to_successors against find_loop_brent:")
+    print("-" * 60)
+
+    heads = [
+        create_loop_list(['A', 'B', 'C', 'D', 'E'], 2),
+        create_loop_list([1, 2, 3, 4], 0),
+        create_loop_list([5, 6, 7], None),
+    ]
+    successors, nodes, head_indices = nodes_to_successors(heads)
+    labels = analyze_successors(successors)
+    for head, i in zip(heads, head_indices):
+        info = find_loop_brent(head)
+        if labels.cycle_entry[i] == -1:
+            print(f"List from {head.data}: no loop (brent: {info})")
+            continue
+        entry = nodes[labels.cycle_entry[i]]
+        match = "✓" if (info and info.entry is entry
+                        and info.tail_length == labels.tail_length[i]
+                        and info.cycle_length == labels.cycle_length[i]) else "✗"
+        print(f"{match} List from {head.data}: entry {entry.data}, "
+              f"μ={labels.tail_length[i]}, λ={labels.cycle_length[i]}")